@@ -11,7 +11,7 @@ if str(PROJECT_ROOT) not in sys.path:
 import streamlit as st
 from config.settings import (REPORT_INPUTS_DIR, FS_LEARNING_INPUTS_DIR,
                               REPORT_OUTPUT_DIR, PROMPTS_CURRENT_DIR)
-from prompts.prompt_manager import get_version_history
+from prompts.prompt_manager import get_version_history, start_warmup
 
 st.set_page_config(
     page_title="Credit Paper Assessment Agent",
@@ -20,6 +20,8 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+start_warmup()
+
 st.title("Credit Paper Assessment Agent")
 st.markdown("Generate, review, and refine SARB financial condition assessment reports.")
 
@@ -1,6 +1,7 @@
 """FastAPI backend for the Credit Paper Assessment application."""
 
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # Ensure project root is importable (for core/, config/, prompts/)
@@ -16,10 +17,19 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
 from backend.routers import assessment, prompts, prompt_sets, examples, settings, reports, pipeline
+from prompts.prompt_manager import start_warmup
 
 FRONTEND_DIR = PROJECT_ROOT / "frontend" / "dist"
 
-app = FastAPI(title="Credit Paper Assessment", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Parse prompts in the background so the first request finds them cached
+    start_warmup()
+    yield
+
+
+app = FastAPI(title="Credit Paper Assessment", version="1.0.0", lifespan=lifespan)
 
 # CORS for React dev server (port 5173)
 app.add_middleware(
@@ -4,7 +4,7 @@ from fastapi import APIRouter, HTTPException, Query
 
 from config.settings import PROMPT_FILES
 from prompts.prompt_manager import (
-    load_prompt, save_prompt, get_version_history,
+    load_prompt, load_prompts, save_prompt, get_version_history,
     load_version, revert_to_version, diff_versions, assemble_prompt_text,
 )
 from backend.schemas import PromptListItem, PromptSaveRequest, VersionListItem
@@ -24,8 +24,7 @@ _LABELS = {
 async def list_prompts(set: str = Query(None, alias="set")) -> list[PromptListItem]:
     """List all available prompt types."""
     result = []
-    for key in PROMPT_FILES:
-        data = load_prompt(key, prompt_set=set)
+    for key, data in load_prompts(PROMPT_FILES, prompt_set=set).items():
         section_count = len(data.get("sections", {})) if data else 0
         result.append(PromptListItem(
             name=key,
@@ -77,11 +76,13 @@ async def get_prompt_preview(name: str, set: str = Query(None, alias="set")):
 
 
 @router.get("/{name}/versions")
-async def get_versions(name: str, set: str = Query(None, alias="set")) -> list[VersionListItem]:
-    """List all versions of a prompt."""
+async def get_versions(name: str, set: str = Query(None, alias="set"),
+                       limit: int = Query(None, ge=1),
+                       offset: int = Query(0, ge=0)) -> list[VersionListItem]:
+    """List versions of a prompt, newest first (all of them unless limit is given)."""
     if name not in PROMPT_FILES:
         raise HTTPException(404, f"Prompt '{name}' not found")
-    versions = get_version_history(name, prompt_set=set)
+    versions = get_version_history(name, prompt_set=set, limit=limit, offset=offset)
     return [
         VersionListItem(
             timestamp=v["timestamp"],
@@ -322,7 +322,7 @@ def archive_assessment(assessment_id: str, final_html: str = None) -> dict:
     inputs_dir = assess_dir / "inputs"
     input_files = [f.name for f in inputs_dir.iterdir() if f.is_file()] if inputs_dir.exists() else []
 
-    from prompts.prompt_manager import get_prompt_set_checksums
+    from prompts.prompt_manager import CHECKSUM_ALGORITHM, get_prompt_set_checksums
 
     metadata = {
         "assessment_id": assessment_id,
@@ -333,6 +333,7 @@ def archive_assessment(assessment_id: str, final_html: str = None) -> dict:
         "generated_at": state.get("generated_at"),
         "finalized_at": state.get("finalized_at"),
         "prompt_checksums": get_prompt_set_checksums(state.get("prompt_set")),
+        "prompt_checksum_algo": CHECKSUM_ALGORITHM,
         "input_files": input_files,
         "section_count": changes["summary"]["total_sections"],
         "sections_modified": changes["summary"]["sections_modified"],
@@ -63,6 +63,21 @@ PROMPT_FILES = {
 GEMINI_UPLOAD_RETRIES = 3
 GEMINI_UPLOAD_DELAY = 20
 GEMINI_FILE_TIMEOUT = 300
+# generate_content retries transient API errors (429/5xx, timeouts) with
+# exponential backoff: base * 2**attempt seconds, capped at the max.
+GEMINI_GENERATE_RETRIES = 5
+GEMINI_RETRY_BASE_DELAY = 2
+GEMINI_RETRY_MAX_DELAY = 60
 FIRECRAWL_POLL_INTERVAL = 10
 FIRECRAWL_POLL_MAX_ATTEMPTS = 18
+# Few-shot example ratio files are inlined into the prompt as text (instead
+# of one Gemini file upload each) up to this rough token budget (~4 chars/token).
+FEW_SHOT_INLINE_TOKEN_BUDGET = 500_000
 SUPPORTED_PARSE_EXTENSIONS = [".xlsx", ".xlsm"]
+# Move (rather than copy) working input files into the archive when a new
+# assessment is started; set False to keep copies in report_inputs.
+ARCHIVE_MOVE_INPUTS = True
+# Pre-parse prompt YAMLs in a background thread when the app starts (FastAPI
+# lifespan, Streamlit app.py): "minimal" warms the default set, "full" every
+# set, "none" disables. Merely importing prompt_manager never starts it.
+PROMPT_WARMUP = os.getenv("PROMPT_WARMUP", "minimal").strip().lower()
@@ -34,9 +34,12 @@ def audit_report(report_path: Path = None,
                  output_dir: Path = None,
                  api_key: str = None,
                  model: str = None,
-                 log_callback=None) -> dict:
+                 log_callback=None,
+                 stream_callback=None) -> dict:
     """Run LLM audit review on a generated HTML report.
 
+    ``stream_callback`` (optional) receives the review text chunk by chunk.
+
     Returns dict with keys: 'success', 'output_path', 'message'.
     """
     out_dir = output_dir or AUDIT_LLM_OUTPUT_DIR
@@ -86,6 +89,8 @@ def audit_report(report_path: Path = None,
             model=model_name,
             contents=prompt_contents,
             temperature=0.2,
+            log_callback=log_callback,
+            stream_callback=stream_callback,
         )
 
         cleaned_html = clean_html_response(audit_html)
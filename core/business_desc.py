@@ -4,6 +4,7 @@ import os
 import re
 import json
 import time
+from functools import lru_cache
 from pathlib import Path
 
 import requests
@@ -26,11 +27,10 @@ def extract_company_info_from_pdf(pdf_path: Path, log_callback=None) -> dict:
             log_callback(msg)
 
     try:
-        from docling.document_converter import DocumentConverter
+        from core.parser import docling_convert
 
         log(f"Extracting company info from PDF: {pdf_path.name}...")
-        converter = DocumentConverter()
-        result = converter.convert(str(pdf_path))
+        result = docling_convert(pdf_path)
         full_text = result.document.export_to_markdown()
 
         if not full_text or not full_text.strip():
@@ -146,6 +146,12 @@ def _clean_name_for_search(full_name: str) -> str:
 # Firecrawl web scraping
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """Shared requests session so Firecrawl calls reuse pooled connections."""
+    return requests.Session()
+
+
 def _firecrawl_search(company_name: str, api_key: str,
                       registration_number: str = None) -> list[str]:
     """Search for company URLs using Firecrawl."""
@@ -163,7 +169,7 @@ def _firecrawl_search(company_name: str, api_key: str,
         "pageOptions": {"includeMarkdown": False, "includeHtml": False}
     }
     try:
-        response = requests.post("https://api.firecrawl.dev/v0/search",
+        response = _http_session().post("https://api.firecrawl.dev/v0/search",
                                  headers=headers, json=payload, timeout=60)
         response.raise_for_status()
         data = response.json()
@@ -190,7 +196,7 @@ def _firecrawl_scrape(url: str, company_name: str, api_key: str) -> str:
         "onlyMainContent": True,
     }
     try:
-        response = requests.post("https://api.firecrawl.dev/v1/scrape",
+        response = _http_session().post("https://api.firecrawl.dev/v1/scrape",
                                  headers=headers, json=payload, timeout=120)
         response.raise_for_status()
         data = response.json()
@@ -206,7 +212,7 @@ def _poll_firecrawl_job(job_id: str, api_key: str) -> str:
     headers = {'Authorization': f'Bearer {api_key}', 'Content-Type': 'application/json'}
     for _ in range(18):
         try:
-            response = requests.get(f"https://api.firecrawl.dev/v0/scrape/{job_id}",
+            response = _http_session().get(f"https://api.firecrawl.dev/v0/scrape/{job_id}",
                                     headers=headers, timeout=30)
             response.raise_for_status()
             data = response.json()
@@ -228,9 +234,9 @@ def _poll_firecrawl_job(job_id: str, api_key: str) -> str:
 def _synthesize_with_gemini(company_name: str, extracted_text: str,
                             api_key: str = None) -> str:
     """Use Gemini to synthesize a concise business description."""
-    from google import genai
+    from core.gemini_client import get_genai_client
     key = api_key or GOOGLE_API_KEY
-    client = genai.Client(api_key=key)
+    client = get_genai_client(key)
     model = MODELS.get("business_description", "gemini-2.5-flash")
 
     if len(extracted_text) > 70000:
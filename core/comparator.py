@@ -87,7 +87,8 @@ def compare_reports(human_report_path: Path = None,
         )
 
         log(f"Sending comparison request to Gemini ({model_name})...")
-        raw_html = client.generate_content(model=model_name, contents=prompt_parts)
+        raw_html = client.generate_content(model=model_name, contents=prompt_parts,
+                                           log_callback=log_callback)
         comparison_html = clean_html_response(raw_html)
 
         # Extract company name from LLM filename for output naming
@@ -3,12 +3,36 @@
 import os
 import re
 import time
+from functools import lru_cache
 from pathlib import Path
 
-from google import genai
-from google.genai import types as genai_types
+from config.settings import (GOOGLE_API_KEY, GEMINI_UPLOAD_RETRIES, GEMINI_UPLOAD_DELAY,
+                             GEMINI_FILE_TIMEOUT, GEMINI_GENERATE_RETRIES,
+                             GEMINI_RETRY_BASE_DELAY, GEMINI_RETRY_MAX_DELAY)
 
-from config.settings import GOOGLE_API_KEY, GEMINI_UPLOAD_RETRIES, GEMINI_UPLOAD_DELAY, GEMINI_FILE_TIMEOUT
+# HTTP status codes worth retrying: rate limiting and transient server errors.
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def _is_transient(exc: Exception) -> bool:
+    """True for rate-limit/server API errors and network timeouts."""
+    import httpx
+    from google.genai import errors as genai_errors
+    if isinstance(exc, genai_errors.APIError):
+        return exc.code in _RETRYABLE_STATUS
+    return isinstance(exc, (httpx.TimeoutException, httpx.NetworkError))
+
+
+@lru_cache(maxsize=None)
+def get_genai_client(api_key: str):
+    """Return a process-wide genai.Client for the given key (reuses its HTTP pool).
+
+    The google-genai SDK is imported here rather than at module level so
+    that importing core modules (e.g. report_sections for parsing) does
+    not pay the SDK import cost until a client is actually needed.
+    """
+    from google import genai
+    return genai.Client(api_key=api_key)
 
 
 class GeminiClient:
@@ -18,7 +42,7 @@ class GeminiClient:
         key = api_key or GOOGLE_API_KEY
         if not key:
             raise ValueError("GOOGLE_API_KEY not configured. Set it in .env or pass it directly.")
-        self.client = genai.Client(api_key=key)
+        self.client = get_genai_client(key)
         self._uploaded_files = []
 
     def upload_file(self, filepath: Path, display_name: str = None,
@@ -61,10 +85,44 @@ class GeminiClient:
 
     def generate_content(self, model: str, contents: list,
                          temperature: float = None,
-                         log_callback=None) -> str:
-        """Generate content using the Gemini API. Returns the text response."""
+                         log_callback=None,
+                         stream_callback=None) -> str:
+        """Generate content using the Gemini API. Returns the text response.
+
+        If ``stream_callback`` is given the response is streamed and the
+        callback receives each text chunk as it arrives; the full text is
+        still returned.
+
+        Transient failures (429/5xx, timeouts) are retried with exponential
+        backoff; each retry is reported through ``log_callback``. A streamed
+        response is only retried if it failed before any text was received.
+        """
+        attempts = max(1, GEMINI_GENERATE_RETRIES)  # always make at least one call
+        for attempt in range(1, attempts + 1):
+            received = []
+
+            def on_chunk(text):
+                received.append(text)
+                stream_callback(text)
+
+            try:
+                return self._generate_once(model, contents, temperature,
+                                           on_chunk if stream_callback is not None else None)
+            except Exception as e:
+                if attempt == attempts or received or not _is_transient(e):
+                    raise
+                delay = min(GEMINI_RETRY_BASE_DELAY * 2 ** (attempt - 1), GEMINI_RETRY_MAX_DELAY)
+                if log_callback:
+                    log_callback(f"Gemini request failed ({e}). "
+                                 f"Retry {attempt}/{attempts - 1} after {delay}s...")
+                time.sleep(delay)
+
+    def _generate_once(self, model: str, contents: list, temperature: float,
+                       stream_callback) -> str:
+        """Single generate_content attempt (see generate_content)."""
         config = None
         if temperature is not None:
+            from google.genai import types as genai_types
             config = genai_types.GenerateContentConfig(
                 temperature=temperature,
                 candidate_count=1
@@ -74,6 +132,9 @@ class GeminiClient:
         if config:
             kwargs["config"] = config
 
+        if stream_callback is not None:
+            return self._generate_streamed(kwargs, stream_callback)
+
         response = self.client.models.generate_content(**kwargs)
 
         # Check for blocking
@@ -103,6 +164,27 @@ class GeminiClient:
 
         return text
 
+    def _generate_streamed(self, kwargs: dict, stream_callback) -> str:
+        """Streaming variant of generate_content."""
+        parts = []
+        finish_reason = ""
+        for chunk in self.client.models.generate_content_stream(**kwargs):
+            feedback = getattr(chunk, 'prompt_feedback', None)
+            if feedback and getattr(feedback, 'block_reason', None):
+                reason = getattr(feedback.block_reason, 'name', str(feedback.block_reason))
+                raise RuntimeError(f"Prompt blocked: {reason}")
+            if chunk.candidates and chunk.candidates[0].finish_reason:
+                finish_reason = chunk.candidates[0].finish_reason.name
+            text = chunk.text if getattr(chunk, 'text', None) else ""
+            if text:
+                parts.append(text)
+                stream_callback(text)
+
+        text = "".join(parts)
+        if not text.strip():
+            raise RuntimeError(f"Empty response from API. Finish reason: {finish_reason}")
+        return text
+
     def cleanup_files(self):
         """Delete all uploaded files from the API."""
         for file_obj in self._uploaded_files:
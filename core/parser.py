@@ -9,6 +9,8 @@ macro-enabled workbooks display their calculated data correctly.
 
 import re
 import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 from config.settings import SUPPORTED_PARSE_EXTENSIONS
@@ -395,18 +397,36 @@ def _resolve_xlsm_formulas(file_path: Path, log_callback=None) -> Path:
 # Docling backend (primary)
 # ---------------------------------------------------------------------------
 
-def _parse_with_docling(file_path: Path, log_callback=None) -> str:
-    """Parse a file to Markdown using Docling (runs locally, no API key)."""
+_DOCLING_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_docling_converter():
+    """Return a shared Docling DocumentConverter (model loading is expensive)."""
     from docling.document_converter import DocumentConverter
+    return DocumentConverter()
+
+
+def docling_convert(file_path: Path):
+    """Convert a document with the shared converter, one conversion at a time.
 
+    The converter is shared across threads (pipeline stages may run
+    concurrently), so access to it is serialised.
+    """
+    converter = get_docling_converter()
+    with _DOCLING_LOCK:
+        return converter.convert(str(file_path))
+
+
+def _parse_with_docling(file_path: Path, log_callback=None) -> str:
+    """Parse a file to Markdown using Docling (runs locally, no API key)."""
     def log(msg):
         if log_callback:
             log_callback(msg)
 
     log(f"Parsing {file_path.name} with Docling...")
 
-    converter = DocumentConverter()
-    result = converter.convert(str(file_path))
+    result = docling_convert(file_path)
     markdown_text = result.document.export_to_markdown()
 
     if not markdown_text or not markdown_text.strip():
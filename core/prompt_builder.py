@@ -75,10 +75,16 @@ def build_report_prompt(company_name: str,
         prompt_contents.append("\n### FEW-SHOT LEARNING EXAMPLES ###")
         prompt_contents.append(examples_preamble)
         for ex in example_files_info:
+            if 'md_text' in ex:
+                ratio_input = (f"--- BEGIN RATIO FILE: {ex['name']} ---\n"
+                               f"{ex['md_text']}\n"
+                               f"--- END RATIO FILE: {ex['name']} ---")
+            else:
+                ratio_input = ex['md_file_obj']
             prompt_contents.extend([
                 f"\n**Example Set: {ex['name']}**",
                 "Input Ratio File:",
-                ex['md_file_obj'],
+                ratio_input,
                 "Final Report Example:",
                 ex['pdf_file_obj'],
             ])
@@ -3,7 +3,8 @@
 import re
 from pathlib import Path
 
-from config.settings import MODELS, REPORT_INPUTS_DIR, FS_LEARNING_INPUTS_DIR, REPORT_OUTPUT_DIR
+from config.settings import (MODELS, REPORT_INPUTS_DIR, FS_LEARNING_INPUTS_DIR, REPORT_OUTPUT_DIR,
+                             FEW_SHOT_INLINE_TOKEN_BUDGET)
 from core.gemini_client import GeminiClient, clean_html_response, safe_filename
 from core.prompt_builder import build_report_prompt
 
@@ -41,9 +42,13 @@ def generate_report(target_inputs_dir: Path = None,
                     model: str = None,
                     report_name: str = None,
                     log_callback=None,
-                    prompt_set: str = None) -> dict:
+                    prompt_set: str = None,
+                    stream_callback=None) -> dict:
     """Generate a Financial Condition Assessment Report.
 
+    ``stream_callback`` (optional) receives the report text chunk by chunk
+    while Gemini generates it.
+
     Returns dict with keys: 'success', 'output_path', 'company_name', 'message'.
     """
     target_dir = target_inputs_dir or REPORT_INPUTS_DIR
@@ -103,20 +108,28 @@ def generate_report(target_inputs_dir: Path = None,
                 if _get_numeric_prefix(p.name)
             }
 
+            # Ratio files are plain Markdown: inline them as text while they
+            # fit the budget rather than paying an upload round trip for each.
+            inline_chars_left = FEW_SHOT_INLINE_TOKEN_BUDGET * 4
             for md_path in learning_md_paths:
                 prefix = _get_numeric_prefix(md_path.name)
                 if prefix and prefix in learning_pdf_map:
                     pdf_path = learning_pdf_map[prefix]
                     ex_name = _extract_company_name(md_path)
-                    log(f"Uploading example pair: {md_path.name} + {pdf_path.name}")
-                    md_obj = client.upload_file(md_path, f"Example MD ({ex_name})")
-                    pdf_obj = client.upload_file(pdf_path, f"Example PDF ({ex_name})")
-                    if md_obj and pdf_obj:
-                        example_files.append({
-                            'md_file_obj': md_obj,
-                            'pdf_file_obj': pdf_obj,
-                            'name': ex_name,
-                        })
+                    md_text = md_path.read_text(encoding='utf-8')
+                    example = {'name': ex_name}
+                    if len(md_text) <= inline_chars_left:
+                        inline_chars_left -= len(md_text)
+                        example['md_text'] = md_text
+                        log(f"Uploading example PDF: {pdf_path.name} (ratios inlined)")
+                    else:
+                        log(f"Uploading example pair: {md_path.name} + {pdf_path.name}")
+                        example['md_file_obj'] = client.upload_file(md_path, f"Example MD ({ex_name})")
+                        if not example['md_file_obj']:
+                            continue
+                    example['pdf_file_obj'] = client.upload_file(pdf_path, f"Example PDF ({ex_name})")
+                    if example['pdf_file_obj']:
+                        example_files.append(example)
 
         # --- Build prompt and call API ---
         log("Building prompt from YAML sections...")
@@ -132,7 +145,9 @@ def generate_report(target_inputs_dir: Path = None,
         )
 
         log(f"Sending request to Gemini ({model_name})...")
-        html_report = client.generate_content(model=model_name, contents=prompt_contents)
+        html_report = client.generate_content(model=model_name, contents=prompt_contents,
+                                              log_callback=log_callback,
+                                              stream_callback=stream_callback)
         cleaned_html = clean_html_response(html_report)
 
         # --- Save report ---
@@ -0,0 +1,14 @@
+"""Writing uploaded files to disk."""
+
+import shutil
+from pathlib import Path
+
+# Copy uploads in 1 MiB chunks rather than reading them into memory whole.
+COPY_BUFSIZE = 1024 * 1024
+
+
+def save_upload(uploaded, dest: Path) -> None:
+    """Stream an uploaded file-like object (e.g. a Streamlit UploadedFile) to ``dest``."""
+    uploaded.seek(0)
+    with open(dest, 'wb') as out:
+        shutil.copyfileobj(uploaded, out, length=COPY_BUFSIZE)
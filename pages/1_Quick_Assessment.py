@@ -1,7 +1,12 @@
 """Page 1: Quick Assessment - Upload, generate, review, and approve a report."""
 
+import copy
+import hashlib
+import os
 import sys
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -11,7 +16,12 @@ if str(PROJECT_ROOT) not in sys.path:
 
 import streamlit as st
 from config.settings import (REPORT_OUTPUT_DIR, MODELS, REPORT_INPUTS_DIR,
-                              ASSESSMENTS_DIR, SUPPORTED_PARSE_EXTENSIONS)
+                              ASSESSMENTS_DIR, SUPPORTED_PARSE_EXTENSIONS,
+                              ARCHIVE_MOVE_INPUTS)
+from core.report_sections import (parse_report_to_sections, section_html_to_text,
+                                   text_to_section_html, reassemble_report_html,
+                                   generate_section_update)
+from core.uploads import COPY_BUFSIZE, save_upload
 
 st.set_page_config(page_title="Quick Assessment", page_icon="⚡", layout="wide")
 
@@ -21,6 +31,7 @@ st.set_page_config(page_title="Quick Assessment", page_icon="⚡", layout="wide"
 _DEFAULTS = {
     "current_report_path": None,
     "current_report_name": None,
+    "last_generated_report_path": None,
     "assessment_complete": False,
     # Review mode state
     "review_mode": False,
@@ -30,53 +41,200 @@ _DEFAULTS = {
     "ai_pending_html": {},
     "review_model_choice": "gemini-2.5-flash",
 }
-for key, default in _DEFAULTS.items():
-    if key not in st.session_state:
-        st.session_state[key] = default
+if not st.session_state.get("_initialized"):
+    st.session_state.update(copy.deepcopy(_DEFAULTS))
+    st.session_state["_initialized"] = True
+# Widget-bound keys are dropped by Streamlit when their widget is not rendered.
+st.session_state.setdefault("selected_review_section", 0)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Helper functions
 # ──────────────────────────────────────────────────────────────────────────────
 
-def _archive_current():
-    """Archive the current working files + report to assessments folder."""
-    work_dir = REPORT_INPUTS_DIR
+_PREVIEW_SUFFIX = '</body></html>'
+
+# Strips every ASCII character that is neither alphanumeric nor a space.
+_SAFE_NAME_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not (chr(c).isalnum() or chr(c) == ' ')))
+
+
+def _safe_name(stem):
+    """Reduce a company stem to alphanumerics and spaces, max 30 chars."""
+    if stem.isascii():
+        safe = stem.translate(_SAFE_NAME_TABLE)
+    else:
+        safe = "".join(c for c in stem if c.isalnum() or c == ' ')
+    return safe.strip()[:30].strip()
+
+
+def _latest_report_path():
+    """Return the most recently generated HTML report, or None.
+
+    Uses the path recorded at generation time; only falls back to scanning
+    REPORT_OUTPUT_DIR when the session has no record of it.
+    """
+    report_path = st.session_state.get("last_generated_report_path")
+    if report_path and Path(report_path).exists():
+        return Path(report_path)
     html_reports = sorted(REPORT_OUTPUT_DIR.glob('*.html'),
                           key=lambda p: p.stat().st_mtime, reverse=True)
-    if not html_reports:
-        return None
+    return html_reports[0] if html_reports else None
+
 
-    report_path = html_reports[0]
+def _archive_current(report_path=None, html_payload=None, move_inputs=False):
+    """Archive the current working files + report to assessments folder.
 
-    excel_files = [f for f in work_dir.iterdir()
-                   if f.is_file() and f.suffix.lower() in ['.xlsx', '.xlsm']]
+    If ``html_payload`` is given it is written straight into the archive
+    instead of copying ``report_path`` back off disk. With ``move_inputs``
+    the working files are renamed into the archive rather than copied, for
+    callers that are about to clean the working dir anyway.
+    """
+    work_dir = REPORT_INPUTS_DIR
+    if report_path is None:
+        report_path = _latest_report_path()
+    if report_path is None:
+        return None
+
+    with os.scandir(work_dir) as it:
+        input_files = [Path(entry.path) for entry in it if entry.is_file()]
+    excel_files = [f for f in input_files if f.suffix.lower() in ['.xlsx', '.xlsm']]
     company_stem = excel_files[0].stem if excel_files else "Assessment"
 
-    safe_name = "".join(c for c in company_stem if c.isalnum() or c == ' ').strip()
-    safe_name = safe_name[:30].strip()
+    safe_name = _safe_name(company_stem)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     assessment_dir = ASSESSMENTS_DIR / f"{safe_name}_{timestamp}"
     assessment_dir.mkdir(parents=True, exist_ok=True)
 
     inputs_subdir = assessment_dir / "inputs"
     inputs_subdir.mkdir(exist_ok=True)
-    for f in work_dir.iterdir():
-        if f.is_file():
-            dest_name = f.name
-            if len(dest_name) > 60:
-                dest_name = f.stem[:50] + f.suffix
-            shutil.copy2(str(f), str(inputs_subdir / dest_name))
+    for f in input_files:
+        dest_name = f.name
+        if len(dest_name) > 60:
+            dest_name = f.stem[:50] + f.suffix
+        if move_inputs:
+            try:
+                os.replace(f, inputs_subdir / dest_name)
+                continue
+            except OSError:
+                pass
+        shutil.copy2(str(f), str(inputs_subdir / dest_name))
 
     report_dest_name = report_path.name
     if len(report_dest_name) > 80:
         report_dest_name = report_path.stem[:70] + report_path.suffix
     report_dest = assessment_dir / report_dest_name
-    shutil.copy2(str(report_path), str(report_dest))
+    if html_payload is not None:
+        report_dest.write_text(html_payload, encoding='utf-8')
+    else:
+        shutil.copy2(str(report_path), str(report_dest))
 
     return assessment_dir.name
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def _read_html_cached(path_str, mtime_ns):
+    """Read an HTML report; cached per (path, mtime) across reruns."""
+    return Path(path_str).read_text(encoding='utf-8')
+
+
+def _read_html(path):
+    """Read an HTML report through the rerun-safe cache."""
+    path = Path(path)
+    return _read_html_cached(str(path), path.stat().st_mtime_ns)
+
+
+def _html_digest(html):
+    """Short content fingerprint used as a cache key for section HTML."""
+    return hashlib.blake2b(html.encode('utf-8'), digest_size=8).hexdigest()
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _section_text_cached(html_hash, _html):
+    """section_html_to_text memoised on the HTML digest (``_html`` is unhashed)."""
+    return section_html_to_text(_html)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _reassemble_cached(fingerprint, _parsed):
+    """reassemble_report_html memoised on a fingerprint of the section HTML."""
+    return reassemble_report_html(_parsed)
+
+
+def _report_fingerprint(parsed):
+    """Cheap fingerprint of a parsed report.
+
+    str hashes are cached on the string objects, so this is O(sections)
+    rather than O(report size) once each section has been hashed.
+    """
+    return hash((parsed.get("head_html", ""),
+                 *(s["html"] for s in parsed["sections"])))
+
+
+@st.cache_resource
+def _prefetch_pool():
+    """Process-wide worker pool for background section prefetching."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="section-prefetch")
+
+
+def _prefetch_section_text(idx, html):
+    """Start converting section ``idx`` to editable text in the background."""
+    digest = _html_digest(html)
+    pending = st.session_state.get("_section_text_prefetch")
+    if pending and pending[:2] == (idx, digest):
+        return
+    future = _prefetch_pool().submit(section_html_to_text, html)
+    st.session_state["_section_text_prefetch"] = (idx, digest, future)
+
+
+def _section_text(idx, html):
+    """Editable text for section ``idx``, reusing a finished prefetch if any."""
+    digest = _html_digest(html)
+    pending = st.session_state.get("_section_text_prefetch")
+    if pending and pending[:2] == (idx, digest):
+        future = pending[2]
+        if future.done() and future.exception() is None:
+            return future.result()
+    return _section_text_cached(digest, html)
+
+
+def _preview_prefix():
+    """Document head wrapper for section previews, built once per parsed report."""
+    prefix = st.session_state.get("_preview_prefix")
+    if prefix is None:
+        head_html = st.session_state.parsed_report.get("head_html", "")
+        prefix = ('<!DOCTYPE html><html><head>' + head_html
+                  + '</head><body style="padding:20px;">')
+        st.session_state["_preview_prefix"] = prefix
+    return prefix
+
+
+def _wrap_preview(body_html):
+    """Wrap section HTML into a standalone preview document."""
+    return _preview_prefix() + body_html + _PREVIEW_SUFFIX
+
+
+def _section_preview_doc(body_html):
+    """Standalone preview document for a section, reused while unchanged."""
+    preview_key = (hash(_preview_prefix()), hash(body_html))
+    if st.session_state.get("_last_preview_key") == preview_key:
+        return st.session_state["_last_preview_doc"]
+    preview_doc = _wrap_preview(body_html)
+    st.session_state["_last_preview_key"] = preview_key
+    st.session_state["_last_preview_doc"] = preview_doc
+    return preview_doc
+
+
+def _spool_evidence(uploaded):
+    """Stream an evidence upload into a uniquely named temp file in report_inputs."""
+    uploaded.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, dir=REPORT_INPUTS_DIR,
+                                     prefix="_temp_evidence_",
+                                     suffix=f"_{uploaded.name}") as out:
+        shutil.copyfileobj(uploaded, out, length=COPY_BUFSIZE)
+    return Path(out.name)
+
+
 def _clean_working_dir():
     """Remove all working files from report_inputs."""
     for old_file in REPORT_INPUTS_DIR.iterdir():
@@ -86,14 +244,13 @@ def _clean_working_dir():
 
 def _reset_all_state():
     """Reset all session state to defaults."""
-    for key, default in _DEFAULTS.items():
-        st.session_state[key] = default
+    st.session_state.update(copy.deepcopy(_DEFAULTS))
 
 
 def _start_new_assessment():
     """Archive current run, clean working dir, reset session state."""
     if st.session_state.current_report_path:
-        _archive_current()
+        _archive_current(move_inputs=ARCHIVE_MOVE_INPUTS)
     _clean_working_dir()
     _reset_all_state()
 
@@ -120,25 +277,72 @@ def _advance_to_next_unapproved():
             return
 
 
+def _index_original_html(parsed):
+    """Record length and hash of each section's original HTML once at parse time."""
+    for s in parsed["sections"]:
+        s["_orig_len"] = len(s["original_html"])
+        s["_orig_hash"] = hash(s["original_html"])
+
+
+def _is_modified(section):
+    """True if the section HTML differs from the original.
+
+    Identity, length and (cached) hash checks settle almost every call
+    without comparing the full strings.
+    """
+    html = section["html"]
+    if html is section["original_html"]:
+        return False
+    if len(html) != section["_orig_len"] or hash(html) != section["_orig_hash"]:
+        return True
+    return html != section["original_html"]
+
+
+def _section_labels(sections):
+    """Selector labels, each prefixed with an approved / modified / pending icon."""
+    section_options = []
+    for s in sections:
+        if s["status"] == "approved":
+            icon = "\u2705"
+        elif _is_modified(s):
+            icon = "\u270E"
+        else:
+            icon = "\u25CB"
+        section_options.append(f"{icon}  {s['title']}")
+    return section_options
+
+
+def _select_section(idx):
+    """Widget callback: jump the review selector to ``idx``."""
+    st.session_state.selected_review_section = idx
+
+
+def _approve_section(idx):
+    """Widget callback: approve section ``idx`` and move to the next pending one."""
+    st.session_state.parsed_report["sections"][idx]["status"] = "approved"
+    _advance_to_next_unapproved()
+
+
+def _rerun_review(status_changed=False):
+    """Rerun the review panel; the full page only if approval status changed."""
+    st.rerun(scope="app" if status_changed else "fragment")
+
+
 def _finalize_report():
     """Reassemble sections into final HTML, save, archive, transition to completed."""
-    from core.report_sections import reassemble_report_html
-
     parsed = st.session_state.parsed_report
     final_html = reassemble_report_html(parsed)
 
-    html_reports = sorted(REPORT_OUTPUT_DIR.glob('*.html'),
-                          key=lambda p: p.stat().st_mtime, reverse=True)
-    if html_reports:
-        output_path = html_reports[0]
+    output_path = _latest_report_path()
+    archive_name = _archive_current(output_path, html_payload=final_html)
+    if output_path:
         output_path.write_text(final_html, encoding='utf-8')
 
-    archive_name = _archive_current()
     if archive_name:
         archived_html = list((ASSESSMENTS_DIR / archive_name).glob('*.html'))
-        if archived_html and html_reports:
+        if archived_html and output_path:
             st.session_state.current_report_path = str(archived_html[0])
-            st.session_state.current_report_name = html_reports[0].name
+            st.session_state.current_report_name = output_path.name
 
     st.session_state.assessment_complete = True
     st.session_state.review_mode = False
@@ -168,7 +372,7 @@ def _render_past_assessments(key_suffix=""):
         past_reports = list(selected_dir.glob('*.html'))
         if past_reports:
             past_report = past_reports[0]
-            past_content = past_report.read_text(encoding='utf-8')
+            past_content = _read_html(past_report)
             col_p1, col_p2 = st.columns([3, 1])
             with col_p2:
                 st.download_button("Download", past_content,
@@ -198,7 +402,7 @@ def _render_completed_view():
         return
 
     st.success(f"Assessment complete: {st.session_state.current_report_name}")
-    content = report_path.read_text(encoding='utf-8')
+    content = _read_html(report_path)
 
     col_dl, col_keep, col_discard = st.columns([2, 1, 1])
     with col_dl:
@@ -228,9 +432,6 @@ def _render_completed_view():
 # ──────────────────────────────────────────────────────────────────────────────
 
 def _render_review_mode():
-    from core.report_sections import (section_html_to_text, text_to_section_html,
-                                       reassemble_report_html, generate_section_update)
-
     sections = st.session_state.parsed_report["sections"]
     approved_count = sum(1 for s in sections if s["status"] == "approved")
     total_count = len(sections)
@@ -269,42 +470,41 @@ def _render_review_mode():
 
     st.markdown("---")
 
+    _section_review_fragment()
+
+
+@st.fragment
+def _section_review_fragment():
+    """Section selector, preview and editing tools.
+
+    Runs as a fragment so navigating and editing only rerun this panel;
+    actions that change a section's approval status rerun the whole page
+    so the header progress stays in sync.
+    """
+    sections = st.session_state.parsed_report["sections"]
+
     # --- Section selector ---
-    section_options = []
-    for i, s in enumerate(sections):
-        if s["status"] == "approved":
-            icon = "\u2705"
-        elif s["html"] != s["original_html"]:
-            icon = "\u270E"
-        else:
-            icon = "\u25CB"
-        section_options.append(f"{icon}  {s['title']}")
+    section_options = _section_labels(sections)
 
     col_sel, col_nav = st.columns([4, 1])
     with col_sel:
         selected_idx = st.selectbox(
             "Select section to review",
             range(len(sections)),
-            index=st.session_state.selected_review_section,
             format_func=lambda i: section_options[i],
-            key="section_selector"
+            key="selected_review_section"
         )
-        if selected_idx != st.session_state.selected_review_section:
-            st.session_state.selected_review_section = selected_idx
-            st.rerun()
 
     with col_nav:
         col_prev, col_next = st.columns(2)
         with col_prev:
-            if st.button("\u25C0 Prev", use_container_width=True,
-                         disabled=selected_idx == 0):
-                st.session_state.selected_review_section = selected_idx - 1
-                st.rerun()
+            st.button("\u25C0 Prev", use_container_width=True,
+                      disabled=selected_idx == 0,
+                      on_click=_select_section, args=(selected_idx - 1,))
         with col_next:
-            if st.button("Next \u25B6", use_container_width=True,
-                         disabled=selected_idx >= len(sections) - 1):
-                st.session_state.selected_review_section = selected_idx + 1
-                st.rerun()
+            st.button("Next \u25B6", use_container_width=True,
+                      disabled=selected_idx >= len(sections) - 1,
+                      on_click=_select_section, args=(selected_idx + 1,))
 
     idx = st.session_state.selected_review_section
     section = sections[idx]
@@ -313,17 +513,13 @@ def _render_review_mode():
     # Status badge
     if section["status"] == "approved":
         st.success(f"**{section['title']}** — Approved")
-    elif section["html"] != section["original_html"]:
+    elif _is_modified(section):
         st.info(f"**{section['title']}** — Modified (needs approval)")
     else:
         st.warning(f"**{section['title']}** — Pending review")
 
     # --- Section preview ---
-    head_html = st.session_state.parsed_report.get("head_html", "")
-    preview_doc = (
-        f'<!DOCTYPE html><html><head>{head_html}</head>'
-        f'<body style="padding:20px;">{current_html}</body></html>'
-    )
+    preview_doc = _section_preview_doc(current_html)
     st.components.v1.html(preview_doc, height=500, scrolling=True)
 
     # --- Approve / Reset buttons ---
@@ -332,20 +528,19 @@ def _render_review_mode():
         approve_label = "Approve Section" if section["status"] != "approved" else "Already Approved"
         if st.button(approve_label, type="primary",
                      key=f"approve_{idx}", use_container_width=True,
-                     disabled=section["status"] == "approved"):
-            section["status"] = "approved"
-            _advance_to_next_unapproved()
+                     disabled=section["status"] == "approved",
+                     on_click=_approve_section, args=(idx,)):
             st.rerun()
     with col_reset:
-        can_reset = (section["html"] != section["original_html"]
-                     or section["status"] != "pending")
+        can_reset = _is_modified(section) or section["status"] != "pending"
         if st.button("Reset to Original", key=f"reset_{idx}",
                      use_container_width=True, disabled=not can_reset):
+            was_approved = section["status"] == "approved"
             section["html"] = section["original_html"]
             section["status"] = "pending"
             if idx in st.session_state.ai_pending_html:
                 del st.session_state.ai_pending_html[idx]
-            st.rerun()
+            _rerun_review(status_changed=was_approved)
 
     st.markdown("---")
 
@@ -357,7 +552,7 @@ def _render_review_mode():
         st.caption("Edit the section content below. Headings use ## / ### / #### markers. "
                    "Tables use | pipe | format. Use **bold** for emphasis.")
 
-        current_text = section_html_to_text(current_html)
+        current_text = _section_text(idx, current_html)
         edited_text = st.text_area(
             "Section content",
             value=current_text,
@@ -378,13 +573,14 @@ def _render_review_mode():
                          disabled=not has_changes):
                 new_html = text_to_section_html(edited_text, section["original_html"])
                 section["html"] = new_html
-                if section["status"] == "approved":
+                was_approved = section["status"] == "approved"
+                if was_approved:
                     section["status"] = "pending"
-                st.rerun()
+                _rerun_review(status_changed=was_approved)
         with col_discard_edit:
             if st.button("Discard Changes", key=f"discard_edit_{idx}",
                          use_container_width=True, disabled=not has_changes):
-                st.rerun()
+                _rerun_review()
 
     # ── TAB 2: AI-powered update ──
     with tab_ai:
@@ -422,29 +618,27 @@ def _render_review_mode():
                          disabled=not instruction.strip()):
                 with st.spinner("AI is updating the section..."):
                     temp_paths = []
-                    if evidence_files:
-                        for ef in evidence_files:
-                            temp_path = REPORT_INPUTS_DIR / f"_temp_evidence_{ef.name}"
-                            temp_path.write_bytes(ef.getvalue())
-                            temp_paths.append(temp_path)
-
-                    full_context = None
-                    if include_full_context:
-                        full_context = reassemble_report_html(
-                            st.session_state.parsed_report
+                    try:
+                        for ef in evidence_files or []:
+                            temp_paths.append(_spool_evidence(ef))
+
+                        full_context = None
+                        if include_full_context:
+                            parsed = st.session_state.parsed_report
+                            full_context = _reassemble_cached(
+                                _report_fingerprint(parsed), parsed
+                            )
+
+                        result = generate_section_update(
+                            section_html=current_html,
+                            instruction=instruction,
+                            evidence_files=temp_paths if temp_paths else None,
+                            full_report_context=full_context,
+                            model=st.session_state.review_model_choice,
                         )
-
-                    result = generate_section_update(
-                        section_html=current_html,
-                        instruction=instruction,
-                        evidence_files=temp_paths if temp_paths else None,
-                        full_report_context=full_context,
-                        model=st.session_state.review_model_choice,
-                    )
-
-                    for tp in temp_paths:
-                        if tp.exists():
-                            tp.unlink()
+                    finally:
+                        for tp in temp_paths:
+                            tp.unlink(missing_ok=True)
 
                     if result["success"]:
                         st.session_state.ai_pending_html[idx] = result["updated_html"]
@@ -457,7 +651,7 @@ def _render_review_mode():
                             {"role": "assistant",
                              "content": "Section updated. Review the proposed changes below."}
                         )
-                        st.rerun()
+                        _rerun_review()
                     else:
                         st.error(f"AI update failed: {result['message']}")
 
@@ -468,10 +662,7 @@ def _render_review_mode():
             st.warning("Review the AI-generated update before accepting.")
 
             proposed_html = st.session_state.ai_pending_html[idx]
-            preview_proposed = (
-                f'<!DOCTYPE html><html><head>{head_html}</head>'
-                f'<body style="padding:20px;">{proposed_html}</body></html>'
-            )
+            preview_proposed = _wrap_preview(proposed_html)
             st.components.v1.html(preview_proposed, height=400, scrolling=True)
 
             col_accept, col_reject = st.columns(2)
@@ -480,15 +671,16 @@ def _render_review_mode():
                              key=f"ai_accept_{idx}",
                              use_container_width=True):
                     section["html"] = proposed_html
-                    if section["status"] == "approved":
+                    was_approved = section["status"] == "approved"
+                    if was_approved:
                         section["status"] = "pending"
                     del st.session_state.ai_pending_html[idx]
-                    st.rerun()
+                    _rerun_review(status_changed=was_approved)
             with col_reject:
                 if st.button("Reject Changes", key=f"ai_reject_{idx}",
                              use_container_width=True):
                     del st.session_state.ai_pending_html[idx]
-                    st.rerun()
+                    _rerun_review()
 
         # --- Chat history ---
         if idx in st.session_state.section_chat_histories:
@@ -497,6 +689,10 @@ def _render_review_mode():
                     with st.chat_message(msg["role"]):
                         st.write(msg["content"])
 
+    # Reviewers usually move on to the next section; convert it ahead of time.
+    if idx + 1 < len(sections):
+        _prefetch_section_text(idx + 1, sections[idx + 1]["html"])
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # STATE 1: Upload & Generate
@@ -569,11 +765,11 @@ def _render_upload_and_generate():
 
         log("Saving uploaded files...")
         ratio_dest = work_dir / ratio_file.name
-        ratio_dest.write_bytes(ratio_file.getvalue())
+        save_upload(ratio_file, ratio_dest)
         log(f"  Saved: {ratio_file.name}")
         for pdf in pdf_files:
             pdf_dest = work_dir / pdf.name
-            pdf_dest.write_bytes(pdf.getvalue())
+            save_upload(pdf, pdf_dest)
             log(f"  Saved: {pdf.name}")
         progress.progress(0.10)
 
@@ -614,6 +810,7 @@ def _render_upload_and_generate():
                 if result["success"]:
                     st.success(result["message"])
                     log(f"Report generated: {result.get('output_path', '')}")
+                    st.session_state.last_generated_report_path = Path(result["output_path"])
                 else:
                     st.error(result["message"])
                     log(f"ERROR: {result['message']}")
@@ -627,16 +824,12 @@ def _render_upload_and_generate():
         # Stage 4: Parse into sections → review mode
         with st.status("Preparing review...", expanded=False):
             try:
-                from core.report_sections import parse_report_to_sections
-
-                html_reports = sorted(REPORT_OUTPUT_DIR.glob('*.html'),
-                                      key=lambda p: p.stat().st_mtime,
-                                      reverse=True)
-                if not html_reports:
+                report_path = _latest_report_path()
+                if report_path is None:
                     st.error("No HTML report found after generation.")
                     st.stop()
 
-                html_content = html_reports[0].read_text(encoding='utf-8')
+                html_content = report_path.read_text(encoding='utf-8')
                 parsed = parse_report_to_sections(html_content)
 
                 if not parsed["sections"]:
@@ -644,6 +837,8 @@ def _render_upload_and_generate():
                     st.stop()
 
                 log(f"Report parsed into {len(parsed['sections'])} sections.")
+                _index_original_html(parsed)
+                st.session_state.pop("_preview_prefix", None)
 
                 st.session_state.parsed_report = parsed
                 st.session_state.review_mode = True
@@ -1,7 +1,10 @@
 """Page 1: Run Assessment Pipeline."""
 
+import hashlib
+import os
+import queue
 import sys
-import shutil
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -11,9 +14,52 @@ if str(PROJECT_ROOT) not in sys.path:
 import streamlit as st
 from config.settings import (REPORT_INPUTS_DIR, FS_LEARNING_INPUTS_DIR,
                               REPORT_OUTPUT_DIR, AUDIT_LLM_INPUT_DIR,
-                              EVAL_INPUT_DIR, MODELS)
+                              EVAL_INPUT_DIR, MODELS, SUPPORTED_PARSE_EXTENSIONS)
+from core.uploads import save_upload
+from prompts.prompt_manager import get_prompt_set_checksums
 
 st.set_page_config(page_title="Run Assessment", page_icon="▶️", layout="wide")
+
+@st.cache_resource
+def _io_pool():
+    """Process-wide thread pool for writing uploaded files to disk."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="upload-writer")
+
+
+def _save_upload(uploaded, dest):
+    """Write an upload to ``dest`` in the background.
+
+    Uploads stay attached to their widget across reruns, so each file is
+    only written once per upload (tracked by its file_id, name and size).
+    """
+    saved = st.session_state.setdefault("saved_uploads", {})
+    upload_key = (uploaded.file_id, uploaded.name, uploaded.size)
+    if saved.get(str(dest)) == upload_key:
+        return
+    saved[str(dest)] = upload_key
+    future = _io_pool().submit(save_upload, uploaded, dest)
+    st.session_state.setdefault("pending_writes", []).append((str(dest), future))
+
+
+def _report_failed_writes(*wait_for_dirs):
+    """Surface errors from finished background writes.
+
+    Writes into any of ``wait_for_dirs`` are waited for first, so files there
+    are complete before they are listed or read.
+    """
+    pending = st.session_state.get("pending_writes", [])
+    if wait_for_dirs:
+        wait([future for dest, future in pending
+              if Path(dest).parent in wait_for_dirs])
+    still_pending = []
+    for dest, future in pending:
+        if not future.done():
+            still_pending.append((dest, future))
+        elif future.exception() is not None:
+            st.session_state["saved_uploads"].pop(dest, None)
+            st.error(f"Failed to save {Path(dest).name}: {future.exception()}")
+    st.session_state["pending_writes"] = still_pending
+
 st.title("Run Assessment")
 st.markdown("Upload input files, configure the pipeline, and generate reports.")
 
@@ -27,16 +73,14 @@ with col_upload1:
     ratio_file = st.file_uploader("Upload Excel ratio file", type=["xlsx", "xlsm"],
                                    key="ratio_upload")
     if ratio_file:
-        dest = REPORT_INPUTS_DIR / ratio_file.name
-        dest.write_bytes(ratio_file.getvalue())
+        _save_upload(ratio_file, REPORT_INPUTS_DIR / ratio_file.name)
         st.success(f"Saved: {ratio_file.name}")
 
     st.markdown("**Audited Financial Statements (.pdf)**")
     pdf_files = st.file_uploader("Upload AFS PDFs", type=["pdf"],
                                   accept_multiple_files=True, key="pdf_upload")
     for pdf in pdf_files:
-        dest = REPORT_INPUTS_DIR / pdf.name
-        dest.write_bytes(pdf.getvalue())
+        _save_upload(pdf, REPORT_INPUTS_DIR / pdf.name)
     if pdf_files:
         st.success(f"Saved {len(pdf_files)} PDF file(s)")
 
@@ -45,24 +89,33 @@ with col_upload2:
     desc_file = st.file_uploader("Upload business description", type=["txt"],
                                   key="desc_upload")
     if desc_file:
-        dest = REPORT_INPUTS_DIR / "company_business_description.txt"
-        dest.write_bytes(desc_file.getvalue())
+        _save_upload(desc_file, REPORT_INPUTS_DIR / "company_business_description.txt")
         st.success("Saved business description")
 
     st.markdown("**Audit Context (.docx)** *(for Stage 4)*")
     audit_ctx = st.file_uploader("Upload LLM risks research DOCX", type=["docx"],
                                   key="audit_ctx_upload")
     if audit_ctx:
-        dest = AUDIT_LLM_INPUT_DIR / audit_ctx.name
-        dest.write_bytes(audit_ctx.getvalue())
+        _save_upload(audit_ctx, AUDIT_LLM_INPUT_DIR / audit_ctx.name)
         st.success(f"Saved: {audit_ctx.name}")
 
+_report_failed_writes()
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _list_input_files(dir_mtime_ns):
+    """(name, size) for each entry in report_inputs, keyed on the directory mtime."""
+    with os.scandir(REPORT_INPUTS_DIR) as it:
+        return sorted((entry.name, entry.stat().st_size) for entry in it)
+
+
 # Show current input files
+_report_failed_writes(REPORT_INPUTS_DIR)
 with st.expander("Current files in report_inputs/"):
-    files = list(REPORT_INPUTS_DIR.iterdir())
+    files = _list_input_files(REPORT_INPUTS_DIR.stat().st_mtime_ns)
     if files:
-        for f in sorted(files):
-            st.text(f"  {f.name} ({f.stat().st_size / 1024:.1f} KB)")
+        for name, size in files:
+            st.text(f"  {name} ({size / 1024:.1f} KB)")
     else:
         st.info("No files yet.")
 
@@ -98,12 +151,19 @@ with col_cfg2:
         "gemini-2.5-flash",
     ], index=0)
 
+@st.cache_data(ttl=10, show_spinner=False)
+def _list_example_mds(dir_mtime_ns):
+    """Sorted names of the few-shot Markdown examples, keyed on the directory mtime."""
+    with os.scandir(FS_LEARNING_INPUTS_DIR) as it:
+        return sorted(entry.name for entry in it if entry.name.endswith('.md'))
+
+
 # Show few-shot examples
 with st.expander("Few-Shot Learning Examples"):
-    example_mds = sorted(FS_LEARNING_INPUTS_DIR.glob('*.md'))
+    example_mds = _list_example_mds(FS_LEARNING_INPUTS_DIR.stat().st_mtime_ns)
     if example_mds:
-        for md in example_mds:
-            st.text(f"  {md.name}")
+        for name in example_mds:
+            st.text(f"  {name}")
     else:
         st.info("No examples loaded. Go to Examples Manager to add some.")
 
@@ -112,7 +172,180 @@ st.markdown("---")
 # --- Run Pipeline ---
 st.subheader("3. Run")
 
+def _stage_parse(log, stream):
+    from core.parser import parse_all_in_directories
+    results = parse_all_in_directories(
+        [REPORT_INPUTS_DIR, FS_LEARNING_INPUTS_DIR],
+        log_callback=log
+    )
+    log(f"Parsed {len(results)} file(s)")
+    return True, f"Stage 1 complete: {len(results)} file(s) parsed"
+
+
+def _stage_business_desc(log, stream):
+    from core.business_desc import extract_business_description
+    desc = extract_business_description(REPORT_INPUTS_DIR, log_callback=log)
+    log(f"Description: {desc[:100]}...")
+    return True, "Stage 2 complete"
+
+
+def _stage_generate(log, stream):
+    from core.report_generator import generate_report
+    result = generate_report(model=model_report, log_callback=log,
+                             stream_callback=stream)
+    return result["success"], result["message"]
+
+
+def _stage_audit(log, stream):
+    from core.auditor import audit_report
+    result = audit_report(model=model_audit, log_callback=log,
+                          stream_callback=stream)
+    return result["success"], result["message"]
+
+
+def _stage_compare(log, stream):
+    from core.comparator import compare_reports
+    result = compare_reports(model=model_report, log_callback=log)
+    return result["success"], result["message"]
+
+
+def _stage_convert(log, stream):
+    from core.converter import convert_all_reports
+    result = convert_all_reports(log_callback=log)
+    log(f"Converted: {len(result['json_files'])} JSON, {len(result['docx_files'])} DOCX")
+    return True, "Stage 6 complete"
+
+
+# (multiselect option, status label, stage function). Stages in the same
+# wave are independent and run concurrently; waves run in order:
+# {1, 2} -> 3 -> {4, 5} -> 6.
+_PIPELINE_WAVES = [
+    [("1. Parse Excel to Markdown", "Stage 1: Parsing Excel files...", _stage_parse),
+     ("2. Extract Business Description", "Stage 2: Extracting business description...",
+      _stage_business_desc)],
+    [("3. Generate Financial Report", "Stage 3: Generating financial report...",
+      _stage_generate)],
+    [("4. Audit LLM Review", "Stage 4: Running audit review...", _stage_audit),
+     ("5. Compare Human vs LLM", "Stage 5: Comparing reports...", _stage_compare)],
+    [("6. Convert to DOCX/JSON", "Stage 6: Converting reports...", _stage_convert)],
+]
+
+
+# Only the tail of a streamed response is shown while it is generating.
+_STREAM_PREVIEW_CHARS = 3000
+
+
+def _run_wave(wave, log):
+    """Run one wave of stages in worker threads, relaying their output.
+
+    Streamlit elements can only be updated from the script thread, so
+    workers push log lines and streamed response chunks onto a queue that
+    is drained here while the stages are in flight.
+    """
+    events = queue.Queue()
+    boxes = []
+    for option, label, fn in wave:
+        box = st.status(label, expanded=True)
+        with box:
+            preview = st.empty()
+        boxes.append((box, preview, option[0], fn))
+    # Per stage: a bounded tail of the streamed text and the total received.
+    tails = [""] * len(boxes)
+    received = [0] * len(boxes)
+
+    def drain():
+        updated = set()
+        while True:
+            try:
+                i, text = events.get_nowait()
+            except queue.Empty:
+                break
+            if i is None:
+                log(text)
+            else:
+                tails[i] = (tails[i] + text)[-_STREAM_PREVIEW_CHARS:]
+                received[i] += len(text)
+                updated.add(i)
+        # One preview update per stage per pass, not one per chunk.
+        for i in updated:
+            boxes[i][1].code(tails[i], language="html")
+
+    def run_stage(i, stage_num, fn):
+        try:
+            return fn(lambda msg: events.put((None, msg)),
+                      lambda text: events.put((i, text)))
+        except Exception as e:
+            events.put((None, f"ERROR: {e}"))
+            return False, f"Stage {stage_num} failed: {e}"
+
+    with ThreadPoolExecutor(max_workers=len(boxes)) as pool:
+        futures = [pool.submit(run_stage, i, num, fn)
+                   for i, (_, _, num, fn) in enumerate(boxes)]
+        pending = set(futures)
+        while pending:
+            _, pending = wait(pending, timeout=0.25)
+            drain()
+    drain()
+
+    results = []
+    for (box, preview, _, _), n_chars, fut in zip(boxes, received, futures):
+        ok, message = fut.result()
+        results.append((ok, message))
+        preview.empty()
+        if n_chars:
+            log(f"Received {n_chars:,} characters from Gemini.")
+        with box:
+            if ok:
+                st.success(message)
+            else:
+                st.error(message)
+        box.update(state="complete" if ok else "error")
+    return results
+
+
+# Uploaded source files; the parsed Markdown and business description that
+# stages 1-2 write into report_inputs are outputs and stay out of the run id.
+_SOURCE_SUFFIXES = ('.xlsx', '.xlsm', '.pdf', '.docx')
+
+
+def _file_listing(directory):
+    """(name, size, mtime_ns) of each file in ``directory``, sorted by name."""
+    with os.scandir(directory) as it:
+        return sorted((entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+                      for entry in it if entry.is_file())
+
+
+def _pipeline_run_id():
+    """Fingerprint of everything stage results depend on, which they are cached under.
+
+    Covers the source inputs, the few-shot examples, the default prompt set's
+    YAML and the selected models, so editing a prompt or an example re-runs
+    the stages instead of serving a stale cached result.
+    """
+    sources = [f for f in _file_listing(REPORT_INPUTS_DIR)
+               if f[0].lower().endswith(_SOURCE_SUFFIXES)]
+    # Markdown that Stage 1 parses out of an example spreadsheet is derived
+    # from a file already in the listing, so it doesn't change the run id.
+    examples = _file_listing(FS_LEARNING_INPUTS_DIR)
+    parsed_stems = {Path(name).stem for name, _, _ in examples
+                    if Path(name).suffix.lower() in SUPPORTED_PARSE_EXTENSIONS}
+    examples = [f for f in examples
+                if not (f[0].endswith('.md') and Path(f[0]).stem in parsed_stems)]
+    prompt_checksums = sorted(get_prompt_set_checksums().items())
+    uploads = sorted(st.session_state.get("saved_uploads", {}).items())
+    fingerprint = repr((sources, examples, prompt_checksums, uploads,
+                        model_report, model_audit))
+    return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()[:12]
+
+
+if st.session_state.get("stage_cache"):
+    if st.button("Clear cached stage results"):
+        st.session_state["stage_cache"] = {}
+        st.rerun()
+
 if st.button("Run Pipeline", type="primary", use_container_width=True):
+    # Stage 1 parses report_inputs and Stage 4 reads the audit context.
+    _report_failed_writes(REPORT_INPUTS_DIR, AUDIT_LLM_INPUT_DIR)
     log_area = st.empty()
     logs = []
 
@@ -124,97 +357,30 @@ if st.button("Run Pipeline", type="primary", use_container_width=True):
     total_stages = len(stages)
     completed = 0
 
-    # Stage 1: Parse
-    if "1. Parse Excel to Markdown" in stages:
-        with st.status("Stage 1: Parsing Excel files...", expanded=True):
-            try:
-                from core.parser import parse_all_in_directories
-                results = parse_all_in_directories(
-                    [REPORT_INPUTS_DIR, FS_LEARNING_INPUTS_DIR],
-                    log_callback=log
-                )
-                log(f"Parsed {len(results)} file(s)")
-                st.success(f"Stage 1 complete: {len(results)} file(s) parsed")
-            except Exception as e:
-                st.error(f"Stage 1 failed: {e}")
-                log(f"ERROR: {e}")
-        completed += 1
-        progress.progress(completed / total_stages)
-
-    # Stage 2: Business Description
-    if "2. Extract Business Description" in stages:
-        with st.status("Stage 2: Extracting business description...", expanded=True):
-            try:
-                from core.business_desc import extract_business_description
-                desc = extract_business_description(REPORT_INPUTS_DIR, log_callback=log)
-                log(f"Description: {desc[:100]}...")
-                st.success("Stage 2 complete")
-            except Exception as e:
-                st.error(f"Stage 2 failed: {e}")
-                log(f"ERROR: {e}")
-        completed += 1
-        progress.progress(completed / total_stages)
-
-    # Stage 3: Generate Report
-    if "3. Generate Financial Report" in stages:
-        with st.status("Stage 3: Generating financial report...", expanded=True):
-            try:
-                from core.report_generator import generate_report
-                result = generate_report(model=model_report, log_callback=log)
-                if result["success"]:
-                    st.success(result["message"])
-                else:
-                    st.error(result["message"])
-            except Exception as e:
-                st.error(f"Stage 3 failed: {e}")
-                log(f"ERROR: {e}")
-        completed += 1
-        progress.progress(completed / total_stages)
-
-    # Stage 4: Audit
-    if "4. Audit LLM Review" in stages:
-        with st.status("Stage 4: Running audit review...", expanded=True):
-            try:
-                from core.auditor import audit_report
-                result = audit_report(model=model_audit, log_callback=log)
-                if result["success"]:
-                    st.success(result["message"])
-                else:
-                    st.error(result["message"])
-            except Exception as e:
-                st.error(f"Stage 4 failed: {e}")
-                log(f"ERROR: {e}")
-        completed += 1
-        progress.progress(completed / total_stages)
-
-    # Stage 5: Compare
-    if "5. Compare Human vs LLM" in stages:
-        with st.status("Stage 5: Comparing reports...", expanded=True):
-            try:
-                from core.comparator import compare_reports
-                result = compare_reports(model=model_report, log_callback=log)
-                if result["success"]:
-                    st.success(result["message"])
-                else:
-                    st.error(result["message"])
-            except Exception as e:
-                st.error(f"Stage 5 failed: {e}")
-                log(f"ERROR: {e}")
-        completed += 1
-        progress.progress(completed / total_stages)
-
-    # Stage 6: Convert
-    if "6. Convert to DOCX/JSON" in stages:
-        with st.status("Stage 6: Converting reports...", expanded=True):
-            try:
-                from core.converter import convert_all_reports
-                result = convert_all_reports(log_callback=log)
-                log(f"Converted: {len(result['json_files'])} JSON, {len(result['docx_files'])} DOCX")
-                st.success("Stage 6 complete")
-            except Exception as e:
-                st.error(f"Stage 6 failed: {e}")
-                log(f"ERROR: {e}")
-        completed += 1
+    # Successful stages are remembered per run id, so re-running after a
+    # partial failure skips work (and API calls) already done. Once any
+    # stage actually runs, later waves are re-run since their inputs changed.
+    run_id = _pipeline_run_id()
+    stage_cache = st.session_state.setdefault("stage_cache", {})
+    upstream_ran = False
+
+    for wave in _PIPELINE_WAVES:
+        selected = [stage for stage in wave if stage[0] in stages]
+        if not selected:
+            continue
+        to_run = []
+        for stage in selected:
+            cached = None if upstream_ran else stage_cache.get((run_id, stage[0][0]))
+            if cached:
+                st.info(f"{cached} (skipped, cached from a previous run)")
+            else:
+                to_run.append(stage)
+        if to_run:
+            for stage, (ok, message) in zip(to_run, _run_wave(to_run, log)):
+                if ok:
+                    stage_cache[(run_id, stage[0][0])] = message
+            upstream_ran = True
+        completed += len(selected)
         progress.progress(completed / total_stages)
 
     progress.progress(1.0)
@@ -225,19 +391,35 @@ st.markdown("---")
 # --- View Output ---
 st.subheader("4. Output Reports")
 
-html_reports = sorted(REPORT_OUTPUT_DIR.glob('*.html'), key=lambda p: p.stat().st_mtime, reverse=True)
+@st.cache_data(ttl=5, show_spinner=False)
+def _list_html_reports(dir_mtime_ns):
+    """{name: path} of each HTML report, newest first; keyed on the directory mtime."""
+    with os.scandir(REPORT_OUTPUT_DIR) as it:
+        entries = [(entry.stat().st_mtime, entry.name, entry.path) for entry in it
+                   if entry.name.endswith('.html') and entry.is_file()]
+    entries.sort(reverse=True)
+    return {name: path for _, name, path in entries}
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _report_bytes(path_str, mtime_ns):
+    """Raw bytes of a report, keyed on its mtime so regenerated reports reload."""
+    return Path(path_str).read_bytes()
+
+
+html_reports = _list_html_reports(REPORT_OUTPUT_DIR.stat().st_mtime_ns)
 if html_reports:
-    selected_report = st.selectbox("Select report to view",
-                                    [r.name for r in html_reports])
-    report_path = REPORT_OUTPUT_DIR / selected_report
+    selected_report = st.selectbox("Select report to view", list(html_reports))
+    report_path = Path(html_reports[selected_report])
+
+    content = _report_bytes(str(report_path), report_path.stat().st_mtime_ns)
 
     col_view1, col_view2 = st.columns([3, 1])
     with col_view2:
-        content = report_path.read_text(encoding='utf-8')
         st.download_button("Download HTML", content, file_name=selected_report,
                           mime="text/html")
 
     with st.expander("Preview Report", expanded=True):
-        st.components.v1.html(content, height=800, scrolling=True)
+        st.components.v1.html(content.decode('utf-8'), height=800, scrolling=True)
 else:
     st.info("No reports generated yet. Run the pipeline above.")
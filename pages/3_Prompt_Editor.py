@@ -9,10 +9,28 @@ if str(PROJECT_ROOT) not in sys.path:
 
 import streamlit as st
 from prompts.prompt_manager import (load_prompt, save_prompt, assemble_prompt_text,
-                                     get_section_titles)
+                                     get_section_titles, get_prompt_path)
 from config.settings import PROMPT_FILES
 
 st.set_page_config(page_title="Prompt Editor", page_icon="✏️", layout="wide")
+
+
+def _prompt_version_key(prompt_name):
+    """(path, mtime_ns) of a prompt's YAML; changes whenever the file is saved."""
+    path = get_prompt_path(prompt_name)
+    mtime_ns = path.stat().st_mtime_ns if path.exists() else 0
+    return str(path), mtime_ns
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_load_prompt(prompt_name, version_key):
+    return load_prompt(prompt_name)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_assemble(prompt_name, version_key):
+    return assemble_prompt_text(prompt_name)
+
 st.title("Prompt Editor")
 st.markdown("Edit prompt sections independently. Changes are versioned automatically on save.")
 
@@ -32,7 +50,7 @@ selected_prompt = st.selectbox(
 )
 
 # Load prompt data
-prompt_data = load_prompt(selected_prompt)
+prompt_data = _cached_load_prompt(selected_prompt, _prompt_version_key(selected_prompt))
 sections = prompt_data.get("sections", {})
 
 if not sections:
@@ -54,25 +72,35 @@ col_list, col_editor = st.columns([1, 3])
 with col_list:
     st.markdown("### Sections")
     section_keys = list(sections.keys())
-    section_labels = [sections[k].get("title", k) for k in section_keys]
-
-    if "selected_section_idx" not in st.session_state:
-        st.session_state.selected_section_idx = 0
-
-    for i, (key, label) in enumerate(zip(section_keys, section_labels)):
-        modified = key in st.session_state[state_key]
-        marker = " *" if modified else ""
-        if st.button(f"{label}{marker}", key=f"sec_btn_{key}",
-                     use_container_width=True,
-                     type="primary" if i == st.session_state.selected_section_idx else "secondary"):
-            st.session_state.selected_section_idx = i
-
-# Editor panel
-with col_editor:
-    idx = st.session_state.selected_section_idx
-    if idx >= len(section_keys):
-        idx = 0
-    current_key = section_keys[idx]
+    pending_edits = st.session_state[state_key]
+
+    # The selection is remembered per prompt rather than through a widget
+    # key: the "*" markers change the radio's labels, which gives it a new
+    # widget identity, and ``index`` then restores the section in view.
+    selection_key = f"selected_section_{selected_prompt}"
+    current_key = st.session_state.get(selection_key)
+    if current_key not in sections:
+        current_key = section_keys[0]
+    current_key = st.radio(
+        "Sections",
+        section_keys,
+        index=section_keys.index(current_key),
+        format_func=lambda k: sections[k].get("title", k) + (" *" if k in pending_edits else ""),
+        label_visibility="collapsed",
+    )
+    st.session_state[selection_key] = current_key
+
+
+@st.fragment
+def _editor_panel(prompt_name, prompt_data, current_key, state_key):
+    """Title/description/content editor for one section plus Save/Discard.
+
+    Runs as a fragment so typing only reruns this panel. A full rerun is
+    requested when the section's modified state flips, so the "*" marker
+    in the section list stays current.
+    """
+    sections = prompt_data["sections"]
+    was_modified = current_key in st.session_state[state_key]
     current_section = sections[current_key]
 
     # Get current values (from edits or original)
@@ -120,7 +148,7 @@ with col_editor:
                     prompt_data["sections"][edit_key]["description"] = edit_vals["description"]
                     prompt_data["sections"][edit_key]["content"] = edit_vals["content"]
 
-            timestamp = save_prompt(selected_prompt, prompt_data)
+            timestamp = save_prompt(prompt_name, prompt_data)
             st.session_state[state_key] = {}
             st.success(f"Saved! Version: {timestamp}")
             st.rerun()
@@ -134,11 +162,19 @@ with col_editor:
         if total_changes > 0:
             st.info(f"{total_changes} section(s) modified (unsaved)")
 
+    if (current_key in st.session_state[state_key]) != was_modified:
+        st.rerun(scope="app")
+
+
+# Editor panel
+with col_editor:
+    _editor_panel(selected_prompt, prompt_data, current_key, state_key)
+
 st.markdown("---")
 
 # --- Assembled Prompt Preview ---
 with st.expander("Preview Assembled Prompt"):
-    full_text = assemble_prompt_text(selected_prompt)
+    full_text = _cached_assemble(selected_prompt, _prompt_version_key(selected_prompt))
     st.text_area("Full prompt text (read-only)", value=full_text, height=400,
                  disabled=True, key="preview_text")
     st.caption(f"Total characters: {len(full_text):,}")
@@ -2,6 +2,7 @@
 
 import sys
 import os
+import re
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -10,8 +11,10 @@ if str(PROJECT_ROOT) not in sys.path:
 
 import streamlit as st
 from config.settings import FS_LEARNING_INPUTS_DIR
+from core.uploads import save_upload
 
 st.set_page_config(page_title="Examples Manager", page_icon="📁", layout="wide")
+
 st.title("Examples Manager")
 st.markdown("Manage few-shot learning example pairs (Markdown ratios + PDF reports) "
             "used during report generation.")
@@ -21,47 +24,61 @@ st.markdown("---")
 # --- Current Examples ---
 st.subheader("Current Examples")
 
-md_files = sorted(FS_LEARNING_INPUTS_DIR.glob('*.md'))
-pdf_files = sorted(FS_LEARNING_INPUTS_DIR.glob('*.pdf'))
-xlsx_files = sorted(FS_LEARNING_INPUTS_DIR.glob('*.xlsx'))
-
 # Build pairs by numeric prefix
-import re
+_PREFIX_RE = re.compile(r"^(\d+)\.?\s*")
+_CLEAN_RE = re.compile(r"[_.-]")
+
 
 def get_prefix(filename):
-    match = re.match(r"^(\d+)\.?\s*", filename)
-    return match.group(1) if match else None
+    return m.group(1) if (m := _PREFIX_RE.match(filename)) else None
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _scan_examples(dir_mtime_ns):
+    """Group example files by numeric prefix as {prefix: [(path, size), ...]}.
+
+    Keyed on the directory mtime, so adding or removing files invalidates it.
+    """
+    prefix_map = {}
+    with os.scandir(FS_LEARNING_INPUTS_DIR) as it:
+        for entry in it:
+            if entry.is_file():
+                prefix = get_prefix(entry.name)
+                if prefix:
+                    prefix_map.setdefault(prefix, []).append(
+                        (Path(entry.path), entry.stat().st_size))
+    return prefix_map
+
 
 # Group files by prefix
-all_files = list(FS_LEARNING_INPUTS_DIR.iterdir())
-prefix_map = {}
-for f in all_files:
-    if f.is_file():
-        prefix = get_prefix(f.name)
-        if prefix:
-            prefix_map.setdefault(prefix, []).append(f)
+prefix_map = _scan_examples(FS_LEARNING_INPUTS_DIR.stat().st_mtime_ns)
 
 if prefix_map:
     for prefix in sorted(prefix_map.keys()):
-        files = prefix_map[prefix]
+        files = [f for f, _ in prefix_map[prefix]]
+        sizes = dict(prefix_map[prefix])
         # Extract a display name from the first file
-        display_name = re.sub(r"^\d+\.?\s*", "", files[0].stem)
-        display_name = re.sub(r"[_.-]", " ", display_name).strip()
+        display_name = _PREFIX_RE.sub("", files[0].stem, count=1)
+        display_name = _CLEAN_RE.sub(" ", display_name).strip()
 
         with st.expander(f"Example {prefix}: {display_name}", expanded=False):
             col_files, col_actions = st.columns([3, 1])
 
             with col_files:
                 for f in sorted(files, key=lambda x: x.suffix):
-                    size_kb = f.stat().st_size / 1024
+                    size_kb = sizes[f] / 1024
                     icon = {"md": "📝", ".pdf": "📄", ".xlsx": "📊"}.get(f.suffix, "📎")
                     st.text(f"  {icon} {f.name} ({size_kb:.1f} KB)")
 
                 # Preview .md content
                 md_in_group = [f for f in files if f.suffix == '.md']
-                if md_in_group:
-                    md_content = md_in_group[0].read_text(encoding='utf-8')
-                    st.text_area("Markdown Preview", value=md_content[:3000],
+                # Expander bodies run even when collapsed, so the file is only
+                # opened once the preview is asked for, and only its head is read.
+                if md_in_group and st.checkbox("Show Markdown preview",
+                                               key=f"show_preview_{prefix}"):
+                    with md_in_group[0].open('r', encoding='utf-8') as fh:
+                        md_content = fh.read(3000)
+                    st.text_area("Markdown Preview", value=md_content,
                                 height=200, disabled=True,
                                 key=f"preview_{prefix}")
 
@@ -105,14 +122,14 @@ if st.button("Add Example Pair", type="primary"):
         if md_prefix and pdf_prefix and md_prefix == pdf_prefix:
             # Save files
             md_dest = FS_LEARNING_INPUTS_DIR / new_md.name
-            md_dest.write_bytes(new_md.getvalue())
+            save_upload(new_md, md_dest)
 
             pdf_dest = FS_LEARNING_INPUTS_DIR / new_pdf.name
-            pdf_dest.write_bytes(new_pdf.getvalue())
+            save_upload(new_pdf, pdf_dest)
 
             if new_xlsx:
                 xlsx_dest = FS_LEARNING_INPUTS_DIR / new_xlsx.name
-                xlsx_dest.write_bytes(new_xlsx.getvalue())
+                save_upload(new_xlsx, xlsx_dest)
 
             st.success(f"Added example pair with prefix {md_prefix}")
             st.rerun()
@@ -120,12 +137,12 @@ if st.button("Add Example Pair", type="primary"):
             st.warning("Files should start with a numeric prefix (e.g., '34. Company Name'). "
                        "Saving anyway...")
             md_dest = FS_LEARNING_INPUTS_DIR / new_md.name
-            md_dest.write_bytes(new_md.getvalue())
+            save_upload(new_md, md_dest)
             pdf_dest = FS_LEARNING_INPUTS_DIR / new_pdf.name
-            pdf_dest.write_bytes(new_pdf.getvalue())
+            save_upload(new_pdf, pdf_dest)
             if new_xlsx:
                 xlsx_dest = FS_LEARNING_INPUTS_DIR / new_xlsx.name
-                xlsx_dest.write_bytes(new_xlsx.getvalue())
+                save_upload(new_xlsx, xlsx_dest)
             st.success("Files saved.")
             st.rerun()
         else:
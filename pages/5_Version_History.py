@@ -9,10 +9,27 @@ if str(PROJECT_ROOT) not in sys.path:
 
 import streamlit as st
 from prompts.prompt_manager import (get_version_history, load_version,
-                                     revert_to_version, diff_versions, load_prompt)
+                                     revert_to_version, diff_versions, load_prompt,
+                                     get_prompt_path)
 from config.settings import PROMPT_FILES
 
 st.set_page_config(page_title="Version History", page_icon="📜", layout="wide")
+
+
+# Versions are immutable by (prompt, timestamp) within a prompt set, so
+# loads and diffs can be cached indefinitely. ``set_key`` (the resolved
+# prompt path) keeps entries for different default sets apart. The version
+# list itself is not cached here: get_version_history already caches it on
+# the history directory's mtime, so saves from anywhere show up at once.
+@st.cache_data(max_entries=128, show_spinner=False)
+def _cached_version(prompt_name, ts, set_key):
+    return load_version(prompt_name, ts)
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _cached_diff(prompt_name, ts1, ts2, set_key):
+    return diff_versions(prompt_name, ts1, ts2)
+
 st.title("Version History")
 st.markdown("Browse, compare, and revert to previous versions of your prompts.")
 
@@ -34,6 +51,7 @@ selected_prompt = st.selectbox(
 st.markdown("---")
 
 # --- Version List ---
+set_key = str(get_prompt_path(selected_prompt))
 versions = get_version_history(selected_prompt)
 
 if not versions:
@@ -72,7 +90,7 @@ if viewing_key in st.session_state:
         v = matching[0]
         st.subheader(f"Viewing Version: {v['display_time']}")
 
-        version_data = load_version(selected_prompt, ts)
+        version_data = _cached_version(selected_prompt, ts, set_key)
         sections = version_data.get("sections", {})
 
         for key, sec in sections.items():
@@ -110,7 +128,7 @@ if len(versions) >= 2:
         ts1 = version_options[v1_idx][0]
         ts2 = version_options[v2_idx][0]
 
-        diffs = diff_versions(selected_prompt, ts1, ts2)
+        diffs = _cached_diff(selected_prompt, ts1, ts2, set_key)
 
         if not diffs:
             st.info("No sections to compare.")
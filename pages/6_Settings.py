@@ -2,6 +2,7 @@
 
 import sys
 import os
+import shutil
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -9,6 +10,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 import streamlit as st
+from dotenv import dotenv_values
 from config.settings import (GOOGLE_API_KEY, LLAMACLOUD_API_KEY, FIRECRAWL_API_KEY,
                               MODELS, PROJECT_ROOT as PROJ_ROOT)
 
@@ -19,18 +21,21 @@ st.markdown("Configure API keys, models, and paths.")
 env_path = PROJ_ROOT / ".env"
 
 # --- Load current .env values ---
+@st.cache_data(max_entries=4, show_spinner=False)
+def _parsed_env(mtime_ns: int) -> dict:
+    """Parse .env once per file version (keyed on its mtime)."""
+    if not mtime_ns:
+        return {}
+    return dotenv_values(env_path)
+
+
 def load_env_values():
     """Load current values from .env file."""
     values = {"GOOGLE_API_KEY": "", "LLAMACLOUD_API_KEY": "", "FIRECRAWL_API_KEY": ""}
-    if env_path.exists():
-        for line in env_path.read_text(encoding='utf-8').splitlines():
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, val = line.split('=', 1)
-                key = key.strip()
-                val = val.strip().strip('"').strip("'")
-                if key in values:
-                    values[key] = val
+    mtime_ns = env_path.stat().st_mtime_ns if env_path.exists() else 0
+    parsed = _parsed_env(mtime_ns)
+    for key in values:
+        values[key] = parsed.get(key) or ""
     return values
 
 
@@ -88,8 +93,26 @@ LLAMACLOUD_API_KEY={llama_key}
 # Firecrawl API Key (for web scraping company descriptions)
 FIRECRAWL_API_KEY={firecrawl_key}
 """
-    env_path.write_text(env_content, encoding='utf-8')
-    st.success("API keys saved to .env. Restart the app for changes to take effect.")
+    # Write a sibling temp file and swap it in, so readers never see a
+    # truncated .env and a failed write leaves the old keys intact. The temp
+    # file is created owner-only and then given the existing .env's mode, so
+    # the swap never loosens the permissions on the keys.
+    tmp_path = env_path.with_name(".env.tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, 'w', encoding='utf-8') as fh:
+            fh.write(env_content)
+            fh.flush()
+            os.fsync(fh.fileno())
+        if env_path.exists():
+            shutil.copymode(env_path, tmp_path)
+        os.replace(tmp_path, env_path)
+    except OSError as e:
+        st.error(f"Failed to save .env: {e}")
+    else:
+        st.success("API keys saved to .env. Restart the app for changes to take effect.")
+    finally:
+        tmp_path.unlink(missing_ok=True)  # only still there if the swap failed
 
 st.markdown("---")
 
@@ -142,7 +165,11 @@ for label, path in paths.items():
     with col_p2:
         st.text(str(path))
     with col_p3:
-        file_count = len(list(path.iterdir())) if path.exists() else 0
+        if path.exists():
+            with os.scandir(path) as it:
+                file_count = sum(1 for _ in it)
+        else:
+            file_count = 0
         st.text(f"{file_count} files")
 
 st.caption("Paths are configured in `config/settings.py`.")
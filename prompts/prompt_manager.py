@@ -1,40 +1,115 @@
 """Prompt management system with set-aware CRUD, versioning, and migration."""
 
-import hashlib
+import copy
 import json
+import os
+import re
 import shutil
-import yaml
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
-from difflib import unified_diff
 
 from config.settings import (
     PROMPT_SETS_DIR, PROMPT_REGISTRY_FILE, DEFAULT_PROMPT_SET,
-    PROMPTS_CURRENT_DIR, PROMPTS_HISTORY_DIR, PROMPT_FILES,
+    PROMPTS_CURRENT_DIR, PROMPTS_HISTORY_DIR, PROMPT_FILES, PROMPT_WARMUP,
 )
 
+# PROMPT_FILES is fixed at import, so iterate a tuple snapshot of it.
+_PROMPT_FILE_ITEMS = tuple(PROMPT_FILES.items())
+
+
+# PyYAML (and libyaml behind it) is imported on first use rather than with
+# this module, so importers that never touch a prompt don't pay for it.
+_YAML = None
+
+
+def _yaml():
+    """(yaml module, safe Loader, safe Dumper), preferring the libyaml classes."""
+    global _YAML
+    if _YAML is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as loader, CSafeDumper as dumper
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader as loader, SafeDumper as dumper
+        _YAML = (yaml, loader, dumper)
+    return _YAML
+
+
+# Emitter options for every prompt file written: block style, keys in
+# insertion order, unicode kept as-is.
+_DUMP_KW = {"default_flow_style": False, "allow_unicode": True,
+            "sort_keys": False, "width": 120}
+
+
+def _dump_prompt(data: dict) -> bytes:
+    """Serialise prompt data to the YAML bytes written to disk."""
+    yaml, _, dumper = _yaml()
+    return yaml.dump(data, Dumper=dumper, **_DUMP_KW).encode("utf-8")
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Registry helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Parsed registry, remembered against the file's (mtime_ns, size) so the
+# many registry lookups per request don't each re-read and re-parse it.
+_REGISTRY_CACHE = {"stamp": None, "data": None}
+
+
+def _registry_stamp() -> tuple[int, int] | None:
+    try:
+        st = PROMPT_REGISTRY_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _registry_view() -> dict:
+    """The cached parsed registry. Shared between callers: do not mutate."""
+    _ensure_migrated()
+    stamp = _registry_stamp()
+    if stamp is None:
+        return {"sets": {}, "default_set": DEFAULT_PROMPT_SET}
+    if stamp != _REGISTRY_CACHE["stamp"]:
+        _REGISTRY_CACHE["data"] = json.loads(PROMPT_REGISTRY_FILE.read_text(encoding="utf-8"))
+        _REGISTRY_CACHE["stamp"] = stamp
+    return _REGISTRY_CACHE["data"]
+
+
 def _load_registry() -> dict:
-    if PROMPT_REGISTRY_FILE.exists():
-        return json.loads(PROMPT_REGISTRY_FILE.read_text(encoding="utf-8"))
-    return {"sets": {}, "default_set": DEFAULT_PROMPT_SET}
+    """A private copy of the registry, safe to modify and pass to _save_registry."""
+    return copy.deepcopy(_registry_view())
 
 
 def _save_registry(registry: dict) -> None:
-    PROMPT_REGISTRY_FILE.write_text(
-        json.dumps(registry, indent=2, default=str), encoding="utf-8"
-    )
+    """Write the registry atomically: readers see either the old or the new file."""
+    tmp_path = PROMPT_REGISTRY_FILE.with_name(PROMPT_REGISTRY_FILE.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(registry, indent=2, default=str), encoding="utf-8")
+        os.replace(tmp_path, PROMPT_REGISTRY_FILE)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    # Re-read on next access even if the filesystem's mtime is too coarse
+    # to tell this write apart from the previous one.
+    _REGISTRY_CACHE["stamp"] = None
 
 
 def _resolve_set(prompt_set: str | None) -> str:
-    """Resolve None to the default set."""
+    """Resolve None to the default set.
+
+    Every prompt and version entry point goes through here, so this is also
+    where the lazy migration runs when a set is named explicitly.
+    """
+    _ensure_migrated()
     if prompt_set:
         return prompt_set
-    return _load_registry().get("default_set", DEFAULT_PROMPT_SET)
+    return _registry_view().get("default_set", DEFAULT_PROMPT_SET)
 
 
 def _set_current_dir(prompt_set: str) -> Path:
@@ -46,7 +121,7 @@ def _set_history_dir(prompt_set: str) -> Path:
 
 
 def _validate_set_exists(prompt_set: str) -> None:
-    registry = _load_registry()
+    registry = _registry_view()
     if prompt_set not in registry["sets"]:
         raise ValueError(f"Prompt set '{prompt_set}' not found")
 
@@ -55,6 +130,27 @@ def _validate_set_exists(prompt_set: str) -> None:
 # One-time migration from flat prompts/current/ to prompts/sets/
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Migration runs on first registry access or set resolution rather than at
+# import; once done, the sentinel file lets later processes skip it after a
+# single stat.
+_MIGRATED = False
+_MIGRATED_SENTINEL = PROMPT_SETS_DIR / ".migrated"
+_MIGRATE_LOCK = threading.Lock()
+
+
+def _ensure_migrated() -> None:
+    global _MIGRATED
+    if _MIGRATED:
+        return
+    with _MIGRATE_LOCK:  # the warm-up thread may get here at the same time
+        if _MIGRATED:
+            return
+        if not _MIGRATED_SENTINEL.exists():
+            _migrate_to_prompt_sets()
+            _MIGRATED_SENTINEL.touch()
+        _MIGRATED = True
+
+
 def _migrate_to_prompt_sets() -> None:
     """Auto-migrate from legacy prompts/current/ into prompts/sets/bdo_sme/."""
     if PROMPT_REGISTRY_FILE.exists():
@@ -113,8 +209,44 @@ def _create_set_dirs(slug: str) -> None:
     (_set_history_dir(slug)).mkdir(parents=True, exist_ok=True)
 
 
-# Run migration on import
-_migrate_to_prompt_sets()
+def _build_set_dir(slug: str, populate) -> None:
+    """Create a set's directories in a staging area, fill current/, then move it into place.
+
+    ``populate`` receives the staging current/ directory. The set appears
+    in a single rename, so a failure part-way never leaves a half-written
+    set behind. The rename also claims the slug: it fails if another
+    caller's set directory is already in place.
+    """
+    target = PROMPT_SETS_DIR / slug
+    if target.exists():
+        raise ValueError(f"Directory for prompt set '{slug}' already exists")
+    PROMPT_SETS_DIR.mkdir(parents=True, exist_ok=True)
+    # A plain mkdir (not tempfile.mkdtemp, which creates 0700 directories)
+    # so the new set gets the same umask-derived mode as every other set.
+    staging = PROMPT_SETS_DIR / f".{slug}-{uuid.uuid4().hex}"
+    staging.mkdir()
+    try:
+        (staging / "current").mkdir()
+        (staging / "history").mkdir()
+        populate(staging / "current")
+        try:
+            os.rename(staging, target)
+        except OSError:
+            if target.exists():
+                raise ValueError(f"Prompt set '{slug}' already exists") from None
+            raise
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def _register_set(slug: str, entry: dict) -> None:
+    """Add a set's entry to a freshly read registry and save it."""
+    registry = _load_registry()
+    if slug in registry["sets"]:
+        raise ValueError(f"Prompt set '{slug}' already exists")
+    registry["sets"][slug] = entry
+    _save_registry(registry)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -123,7 +255,7 @@ _migrate_to_prompt_sets()
 
 def list_prompt_sets() -> list[dict]:
     """List all prompt sets with metadata."""
-    registry = _load_registry()
+    registry = _registry_view()
     default = registry.get("default_set", DEFAULT_PROMPT_SET)
     result = []
     for slug, info in registry.get("sets", {}).items():
@@ -140,7 +272,7 @@ def list_prompt_sets() -> list[dict]:
 
 def get_prompt_set_info(prompt_set: str) -> dict:
     """Return metadata for a single set."""
-    registry = _load_registry()
+    registry = _registry_view()
     info = registry["sets"].get(prompt_set)
     if not info:
         raise ValueError(f"Prompt set '{prompt_set}' not found")
@@ -153,22 +285,21 @@ def get_prompt_set_info(prompt_set: str) -> dict:
 
 def create_prompt_set(slug: str, display_name: str, description: str = "") -> dict:
     """Create a new prompt set with blank YAML files."""
-    registry = _load_registry()
-    if slug in registry["sets"]:
+    if slug in _registry_view()["sets"]:
         raise ValueError(f"Prompt set '{slug}' already exists")
 
-    _create_set_dirs(slug)
-
     # Create blank YAML files with structure matching PROMPT_FILES
-    for key, filename in PROMPT_FILES.items():
-        blank = {
-            "metadata": {"name": key, "description": ""},
-            "sections": {},
-        }
-        filepath = _set_current_dir(slug) / filename
-        with open(filepath, "w", encoding="utf-8") as f:
-            yaml.dump(blank, f, default_flow_style=False, allow_unicode=True,
-                      sort_keys=False, width=120)
+    def write_blanks(current_dir: Path) -> None:
+        for key, filename in _PROMPT_FILE_ITEMS:
+            blank = {
+                "metadata": {"name": key, "description": ""},
+                "sections": {},
+            }
+            # Dump to a string and write it in one go, as save_prompt does,
+            # rather than letting the emitter issue many small writes.
+            current_dir.joinpath(filename).write_bytes(_dump_prompt(blank))
+
+    _build_set_dir(slug, write_blanks)
 
     entry = {
         "display_name": display_name,
@@ -176,27 +307,29 @@ def create_prompt_set(slug: str, display_name: str, description: str = "") -> di
         "created_at": datetime.now().isoformat(),
         "cloned_from": None,
     }
-    registry["sets"][slug] = entry
-    _save_registry(registry)
+    _register_set(slug, entry)
     return {"slug": slug, **entry}
 
 
 def clone_prompt_set(source_set: str, new_slug: str, new_display_name: str,
                      new_description: str = "") -> dict:
     """Clone all current prompt files from source into a new set."""
-    registry = _load_registry()
+    registry = _registry_view()
     if source_set not in registry["sets"]:
         raise ValueError(f"Source set '{source_set}' not found")
     if new_slug in registry["sets"]:
         raise ValueError(f"Prompt set '{new_slug}' already exists")
 
-    _create_set_dirs(new_slug)
-
     # Copy current YAML files
     src_dir = _set_current_dir(source_set)
-    dst_dir = _set_current_dir(new_slug)
-    for yaml_file in src_dir.glob("*.yaml"):
-        shutil.copy2(str(yaml_file), str(dst_dir / yaml_file.name))
+
+    def copy_current(dst_dir: Path) -> None:
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".yaml") and entry.is_file():
+                    shutil.copy2(entry.path, dst_dir / entry.name)
+
+    _build_set_dir(new_slug, copy_current)
 
     entry = {
         "display_name": new_display_name,
@@ -204,8 +337,7 @@ def clone_prompt_set(source_set: str, new_slug: str, new_display_name: str,
         "created_at": datetime.now().isoformat(),
         "cloned_from": source_set,
     }
-    registry["sets"][new_slug] = entry
-    _save_registry(registry)
+    _register_set(new_slug, entry)
     return {"slug": new_slug, **entry}
 
 
@@ -215,12 +347,16 @@ def rename_prompt_set(prompt_set: str, new_display_name: str = None,
     registry = _load_registry()
     if prompt_set not in registry["sets"]:
         raise ValueError(f"Prompt set '{prompt_set}' not found")
+    entry = registry["sets"][prompt_set]
+    updates = {}
     if new_display_name is not None:
-        registry["sets"][prompt_set]["display_name"] = new_display_name
+        updates["display_name"] = new_display_name
     if new_description is not None:
-        registry["sets"][prompt_set]["description"] = new_description
-    _save_registry(registry)
-    return {"slug": prompt_set, **registry["sets"][prompt_set]}
+        updates["description"] = new_description
+    if any(entry.get(k) != v for k, v in updates.items()):
+        entry.update(updates)
+        _save_registry(registry)
+    return {"slug": prompt_set, **entry}
 
 
 def delete_prompt_set(prompt_set: str) -> None:
@@ -240,6 +376,7 @@ def delete_prompt_set(prompt_set: str) -> None:
 
     del registry["sets"][prompt_set]
     _save_registry(registry)
+    _invalidate_prompt_cache(prompt_set)
 
 
 def set_default_prompt_set(prompt_set: str) -> None:
@@ -247,34 +384,161 @@ def set_default_prompt_set(prompt_set: str) -> None:
     registry = _load_registry()
     if prompt_set not in registry["sets"]:
         raise ValueError(f"Prompt set '{prompt_set}' not found")
-    registry["default_set"] = prompt_set
-    _save_registry(registry)
+    if registry.get("default_set") != prompt_set:
+        registry["default_set"] = prompt_set
+        _save_registry(registry)
+
+
+# Recorded next to stored checksums (e.g. assessment metadata.json) so they
+# can be told apart from the MD5 digests written before the switch.
+CHECKSUM_ALGORITHM = "blake2b-128"
+
+
+def _file_checksum(path: Path) -> str:
+    """BLAKE2b-128 hex digest of a file, hashed in 64 KiB blocks rather than read whole."""
+    import hashlib
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while block := f.read(65536):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# Digests by path -> (size, mtime_ns, hex digest), so repeated checksum polls
+# only stat files that haven't changed.
+_CHECKSUM_CACHE: dict[Path, tuple[int, int, str]] = {}
 
 
 def get_prompt_set_checksums(prompt_set: str = None) -> dict[str, str]:
-    """Compute MD5 checksums for all YAML files in a prompt set."""
+    """Compute BLAKE2b checksums for all YAML files in a prompt set."""
     prompt_set = _resolve_set(prompt_set)
     current_dir = _set_current_dir(prompt_set)
     checksums = {}
-    for key, filename in PROMPT_FILES.items():
-        path = current_dir / filename
-        if path.exists():
-            checksums[key] = hashlib.md5(path.read_bytes()).hexdigest()
+    for key, filename in _PROMPT_FILE_ITEMS:
+        digest = _cached_checksum(current_dir.joinpath(filename))
+        if digest is not None:
+            checksums[key] = digest
     return checksums
 
 
+def _cached_checksum(path: Path, st: os.stat_result = None) -> str | None:
+    """Checksum of ``path`` from the cache if its size and mtime still match, else rehash.
+
+    Returns None if the file doesn't exist.
+    """
+    try:
+        if st is None:
+            st = path.stat()
+        cached = _CHECKSUM_CACHE.get(path)
+        if cached and cached[:2] == (st.st_size, st.st_mtime_ns):
+            return cached[2]
+        digest = _file_checksum(path)
+    except FileNotFoundError:
+        _CHECKSUM_CACHE.pop(path, None)
+        return None
+    _CHECKSUM_CACHE[path] = (st.st_size, st.st_mtime_ns, digest)
+    return digest
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Prompt CRUD (set-aware versions of original functions)
 # ──────────────────────────────────────────────────────────────────────────────
 
+def get_prompt_path(prompt_name: str, prompt_set: str = None) -> Path:
+    """Return the current YAML path for a prompt in the specified (or default) set."""
+    prompt_set = _resolve_set(prompt_set)
+    return _set_current_dir(prompt_set) / f"{prompt_name}.yaml"
+
+
+# Parsed YAML files (current prompts and history versions) by path ->
+# ((mtime_ns, size), data), least recently used first.
+_YAML_CACHE: OrderedDict[Path, tuple[tuple[int, int], dict]] = OrderedDict()
+_YAML_CACHE_SIZE = 128
+_YAML_CACHE_LOCK = threading.Lock()
+
+# Version listings by (prompt_set, prompt_name) -> (history dir mtime_ns, versions).
+_HISTORY_CACHE: dict[tuple[str, str], tuple[int, list[dict]]] = {}
+
+
+def _invalidate_prompt_cache(prompt_set: str, prompt_name: str = None) -> None:
+    """Drop cached prompts, checksums and version listings for one prompt, or the whole set."""
+    set_dir = PROMPT_SETS_DIR / prompt_set
+    with _YAML_CACHE_LOCK:
+        if prompt_name is not None:
+            current = _set_current_dir(prompt_set) / f"{prompt_name}.yaml"
+            _YAML_CACHE.pop(current, None)
+            _CHECKSUM_CACHE.pop(current, None)
+        else:
+            for path in [p for p in _YAML_CACHE if p.is_relative_to(set_dir)]:
+                del _YAML_CACHE[path]
+            for path in [p for p in _CHECKSUM_CACHE if p.is_relative_to(set_dir)]:
+                del _CHECKSUM_CACHE[path]
+    for key in list(_HISTORY_CACHE):
+        if key[0] == prompt_set and prompt_name in (None, key[1]):
+            _HISTORY_CACHE.pop(key, None)
+
+
+def _intern_sections(data: dict) -> dict:
+    """Intern section keys and titles, which repeat across prompts and versions.
+
+    Content strings are long and unique, so they are left alone.
+    """
+    sections = data.get("sections")
+    if isinstance(sections, dict):
+        for section in sections.values():
+            if isinstance(section, dict) and isinstance(section.get("title"), str):
+                section["title"] = sys.intern(section["title"])
+        data["sections"] = {sys.intern(k) if isinstance(k, str) else k: v
+                            for k, v in sections.items()}
+    return data
+
+
+def _read_yaml(filepath: Path) -> dict | None:
+    """Parsed contents of a prompt YAML file, or None if it doesn't exist.
+
+    Results are cached until the file's mtime or size changes. The returned
+    dict is shared with the cache: copy it before handing it to callers.
+    """
+    try:
+        st = filepath.stat()
+    except FileNotFoundError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(filepath)
+        if cached and cached[0] == stamp:
+            _YAML_CACHE.move_to_end(filepath)
+            return cached[1]
+
+    yaml, loader, _ = _yaml()
+    with open(filepath, "r", encoding="utf-8") as f:
+        data = _intern_sections(yaml.load(f, Loader=loader) or {})
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[filepath] = (stamp, data)
+        _YAML_CACHE.move_to_end(filepath)
+        while len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+    return data
+
+
 def load_prompt(prompt_name: str, prompt_set: str = None) -> dict:
-    """Load a prompt YAML file from the specified (or default) set."""
+    """Load a prompt YAML file from the specified (or default) set.
+
+    Callers get a deep copy of the cached parse, so mutating the result
+    never touches the cache.
+    """
     prompt_set = _resolve_set(prompt_set)
-    filepath = _set_current_dir(prompt_set) / f"{prompt_name}.yaml"
-    if not filepath.exists():
+    data = _read_yaml(_set_current_dir(prompt_set) / f"{prompt_name}.yaml")
+    if data is None:
         return {"metadata": {"name": prompt_name, "description": ""}, "sections": {}}
-    with open(filepath, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return copy.deepcopy(data)
+
+
+def load_prompts(prompt_names, prompt_set: str = None) -> dict[str, dict]:
+    """Load several prompts from one set, resolving the set only once."""
+    prompt_set = _resolve_set(prompt_set)
+    return {name: load_prompt(name, prompt_set) for name in prompt_names}
 
 
 def save_prompt(prompt_name: str, data: dict, prompt_set: str = None) -> str:
@@ -282,93 +546,206 @@ def save_prompt(prompt_name: str, data: dict, prompt_set: str = None) -> str:
     Returns the timestamp string."""
     prompt_set = _resolve_set(prompt_set)
     filepath = _set_current_dir(prompt_set) / f"{prompt_name}.yaml"
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = _version_timestamp()
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True,
-                  sort_keys=False, width=120)
+    payload = _dump_prompt(data)
 
-    history_dir = _set_history_dir(prompt_set) / prompt_name
-    history_dir.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(str(filepath), str(history_dir / f"{prompt_name}_{timestamp}.yaml"))
+    # Saving unchanged data would only add a duplicate history entry; if the
+    # current file and the latest snapshot already hold this payload, reuse it.
+    unchanged = _unchanged_version(prompt_set, prompt_name, filepath, payload)
+    if unchanged:
+        return unchanged
 
+    _write_atomic(filepath, payload)
+    _write_version(prompt_set, prompt_name, timestamp, payload)
+    _invalidate_prompt_cache(prompt_set, prompt_name)
     return timestamp
 
 
-def get_version_history(prompt_name: str, prompt_set: str = None) -> list[dict]:
-    """List all historical versions for a prompt, newest first."""
+def _version_timestamp() -> str:
+    """Local-time YYYYMMDD_HHMMSS key for a new history version."""
+    return time.strftime("%Y%m%d_%H%M%S")
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """Replace ``path`` with ``payload`` via a temp file, so readers never see a partial write."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _unchanged_version(prompt_set: str, prompt_name: str, filepath: Path,
+                       payload: bytes) -> str | None:
+    """Timestamp of the latest version if it and the current file equal ``payload``.
+
+    Compares checksums, which usually come straight from the checksum cache.
+    """
+    import hashlib
+
+    versions = get_version_history(prompt_name, prompt_set, limit=1)
+    if not versions:
+        return None
+    try:
+        current_st = filepath.stat()
+        latest_st = versions[0]["path"].stat()
+    except FileNotFoundError:
+        return None
+    if current_st.st_size != len(payload) or latest_st.st_size != len(payload):
+        return None
+
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    if _cached_checksum(filepath, current_st) != digest:
+        return None
+    if _cached_checksum(versions[0]["path"], latest_st) != digest:
+        return None
+    return versions[0]["timestamp"]
+
+
+def _write_version(prompt_set: str, prompt_name: str, timestamp: str,
+                   payload: bytes) -> None:
+    """Write ``payload`` into history as the version for ``timestamp``.
+
+    Snapshots are written as files of their own, never linked to the current
+    file, so nothing that edits the current file in place can alter history.
+    """
+    history_path = _version_path(prompt_set, prompt_name, timestamp)
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(history_path, payload)
+
+
+def get_version_history(prompt_name: str, prompt_set: str = None,
+                        limit: int = None, offset: int = 0) -> list[dict]:
+    """List historical versions for a prompt, newest first.
+
+    ``limit``/``offset`` page through the list; by default all versions are
+    returned. Listings are cached against the history directory's mtime,
+    which changes whenever a snapshot is added or removed.
+    """
     prompt_set = _resolve_set(prompt_set)
     history_dir = _set_history_dir(prompt_set) / prompt_name
-    if not history_dir.exists():
+    try:
+        dir_mtime_ns = history_dir.stat().st_mtime_ns
+    except FileNotFoundError:
         return []
-
+    key = (prompt_set, prompt_name)
+    cached = _HISTORY_CACHE.get(key)
+    if cached and cached[0] == dir_mtime_ns:
+        return [dict(v) for v in _page(cached[1], limit, offset)]
+
+    # Timestamps are fixed-width YYYYMMDD_HHMMSS, so names sort
+    # chronologically as strings and the regex both validates and extracts them.
+    pattern = re.compile(rf"{re.escape(prompt_name)}_(\d{{8}}_\d{{6}})\.yaml")
+    with os.scandir(history_dir) as it:
+        matches = [m for m in map(pattern.fullmatch, (e.name for e in it)) if m]
+    matches.sort(key=lambda m: m.string, reverse=True)
     versions = []
-    for f in sorted(history_dir.glob(f"{prompt_name}_*.yaml"), reverse=True):
-        ts_part = f.stem.replace(f"{prompt_name}_", "")
-        try:
-            dt = datetime.strptime(ts_part, "%Y%m%d_%H%M%S")
-            versions.append({
-                "timestamp": ts_part,
-                "display_time": dt.strftime("%Y-%m-%d %H:%M:%S"),
-                "filename": f.name,
-                "path": f,
-            })
-        except ValueError:
-            continue
-    return versions
+    for m in matches:
+        ts_part = m.group(1)
+        versions.append({
+            "timestamp": ts_part,
+            "display_time": (f"{ts_part[0:4]}-{ts_part[4:6]}-{ts_part[6:8]} "
+                             f"{ts_part[9:11]}:{ts_part[11:13]}:{ts_part[13:15]}"),
+            "filename": m.string,
+            "path": history_dir / m.string,
+        })
+    _HISTORY_CACHE[key] = (dir_mtime_ns, versions)
+    return [dict(v) for v in _page(versions, limit, offset)]
+
+
+def _page(items: list, limit: int | None, offset: int) -> list:
+    return items[offset:] if limit is None else items[offset:offset + limit]
+
+
+def _version_path(prompt_set: str, prompt_name: str, timestamp: str) -> Path:
+    return _set_history_dir(prompt_set) / prompt_name / f"{prompt_name}_{timestamp}.yaml"
+
+
+def _same_file_contents(path1: Path, path2: Path) -> bool:
+    """True if both files exist and hold identical bytes (sizes compared first)."""
+    try:
+        if path1.stat().st_size != path2.stat().st_size:
+            return False
+        return path1.read_bytes() == path2.read_bytes()
+    except FileNotFoundError:
+        return False
 
 
 def load_version(prompt_name: str, timestamp: str, prompt_set: str = None) -> dict:
     """Load a specific historical version of a prompt."""
     prompt_set = _resolve_set(prompt_set)
-    filepath = _set_history_dir(prompt_set) / prompt_name / f"{prompt_name}_{timestamp}.yaml"
-    if not filepath.exists():
-        return {}
-    with open(filepath, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    data = _read_yaml(_version_path(prompt_set, prompt_name, timestamp))
+    return copy.deepcopy(data) if data is not None else {}
 
 
 def revert_to_version(prompt_name: str, timestamp: str, prompt_set: str = None) -> str:
     """Restore a historical version as current. Creates new history entry."""
     prompt_set = _resolve_set(prompt_set)
-    old_data = load_version(prompt_name, timestamp, prompt_set)
-    if not old_data:
+    if not _read_yaml(_version_path(prompt_set, prompt_name, timestamp)):
         raise ValueError(f"Version {timestamp} not found for prompt {prompt_name}")
-    return save_prompt(prompt_name, old_data, prompt_set)
+
+    # The snapshot already holds the exact YAML to restore, so write its bytes
+    # rather than re-dumping the parsed data.
+    filepath = _set_current_dir(prompt_set) / f"{prompt_name}.yaml"
+    new_timestamp = _version_timestamp()
+    payload = _version_path(prompt_set, prompt_name, timestamp).read_bytes()
+    _write_atomic(filepath, payload)
+    _write_version(prompt_set, prompt_name, new_timestamp, payload)
+    _invalidate_prompt_cache(prompt_set, prompt_name)
+    return new_timestamp
+
+
+_MISSING = object()
 
 
 def diff_versions(prompt_name: str, ts1: str, ts2: str, prompt_set: str = None) -> dict:
     """Compare two versions section by section."""
+    from difflib import unified_diff
+
     prompt_set = _resolve_set(prompt_set)
-    v1 = load_version(prompt_name, ts1, prompt_set)
-    v2 = load_version(prompt_name, ts2, prompt_set)
+    path1 = _version_path(prompt_set, prompt_name, ts1)
+    path2 = _version_path(prompt_set, prompt_name, ts2)
+
+    # Reverts re-save an older version verbatim, so identical snapshots are
+    # common; when the files match byte for byte, parse one and skip the diff.
+    if _same_file_contents(path1, path2):
+        sections = (_read_yaml(path1) or {}).get("sections", {})
+        return {key: {"status": "unchanged", "diff": ""} for key in sorted(sections)}
+
+    # Read-only use, so the shared cached parses are used without copying.
+    v1 = _read_yaml(path1) or {}
+    v2 = _read_yaml(path2) or {}
 
     s1 = v1.get("sections", {})
     s2 = v2.get("sections", {})
-    all_keys = set(list(s1.keys()) + list(s2.keys()))
+    if s1 == s2:  # e.g. only metadata differs
+        return {key: {"status": "unchanged", "diff": ""} for key in sorted(s1)}
+    s1_get, s2_get = s1.get, s2.get
     diffs = {}
 
-    for key in sorted(all_keys):
-        sec1 = s1.get(key, {})
-        sec2 = s2.get(key, {})
-        content1 = sec1.get("content", "")
-        content2 = sec2.get("content", "")
+    for key in sorted(s1.keys() | s2.keys()):
+        sec1 = s1_get(key, _MISSING)
+        sec2 = s2_get(key, _MISSING)
+        content1 = "" if sec1 is _MISSING else sec1.get("content", "")
+        content2 = "" if sec2 is _MISSING else sec2.get("content", "")
 
         if content1 == content2:
             diffs[key] = {"status": "unchanged", "diff": ""}
-        elif key not in s1:
+        elif sec1 is _MISSING:
             diffs[key] = {"status": "added", "diff": content2}
-        elif key not in s2:
+        elif sec2 is _MISSING:
             diffs[key] = {"status": "removed", "diff": content1}
         else:
-            diff_lines = list(unified_diff(
+            diffs[key] = {"status": "changed", "diff": "\n".join(unified_diff(
                 content1.splitlines(keepends=True),
                 content2.splitlines(keepends=True),
                 fromfile=f"v1 ({ts1})",
                 tofile=f"v2 ({ts2})",
                 lineterm=""
-            ))
-            diffs[key] = {"status": "changed", "diff": "\n".join(diff_lines)}
+            ))}
 
     return diffs
 
@@ -377,12 +754,10 @@ def assemble_prompt_text(prompt_name: str, prompt_set: str = None) -> str:
     """Concatenate all sections of a prompt into a single text block."""
     data = load_prompt(prompt_name, prompt_set)
     sections = data.get("sections", {})
-    parts = []
-    for key, section in sections.items():
-        title = section.get("title", key)
-        content = section.get("content", "")
-        parts.append(f"**{title}**\n\n{content}")
-    return "\n\n".join(parts)
+    return "\n\n".join(
+        f"**{section.get('title', key)}**\n\n{section.get('content', '')}"
+        for key, section in sections.items()
+    )
 
 
 def get_section_titles(prompt_name: str, prompt_set: str = None) -> list[tuple[str, str]]:
@@ -390,3 +765,40 @@ def get_section_titles(prompt_name: str, prompt_set: str = None) -> list[tuple[s
     data = load_prompt(prompt_name, prompt_set)
     sections = data.get("sections", {})
     return [(key, sec.get("title", key)) for key, sec in sections.items()]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Cache warm-up
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _warmup(mode: str) -> None:
+    """Parse current prompts into the YAML cache ahead of the first request."""
+    try:
+        registry = _registry_view()
+        if mode == "full":
+            slugs = list(registry["sets"])
+        else:
+            slugs = [registry.get("default_set", DEFAULT_PROMPT_SET)]
+        for slug in slugs:
+            current_dir = _set_current_dir(slug)
+            for _, filename in _PROMPT_FILE_ITEMS:
+                _read_yaml(current_dir / filename)
+    except Exception:
+        pass  # best effort: a bad file is reported when it is actually loaded
+
+
+_WARMUP_STARTED = False
+
+
+def start_warmup(mode: str = PROMPT_WARMUP) -> None:
+    """Start warming the prompt cache in a daemon thread, once per process.
+
+    Called explicitly by the app entry points; ``mode`` is "minimal" (default
+    set), "full" (every set) or "none".
+    """
+    global _WARMUP_STARTED
+    if _WARMUP_STARTED or mode not in ("minimal", "full"):
+        return
+    _WARMUP_STARTED = True
+    threading.Thread(target=_warmup, args=(mode,),
+                     name="prompt-warmup", daemon=True).start()
@@ -3,6 +3,7 @@
 Usage: python start.py
 """
 
+import os
 import subprocess
 import sys
 import webbrowser
@@ -37,16 +38,32 @@ def install_frontend():
         )
 
 
+def _modified_since(directory, mtime_ns):
+    """True as soon as any entry under directory is newer than mtime_ns.
+
+    Directory mtimes are checked too, so deleted or renamed files count.
+    Symlinks are judged by the link itself, so a dangling one can't fail the check.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.stat(follow_symlinks=False).st_mtime_ns >= mtime_ns:
+                return True
+            if entry.is_dir(follow_symlinks=False) and _modified_since(entry.path, mtime_ns):
+                return True
+    return False
+
+
 def build_frontend():
     """Build the React frontend if dist/ is missing or stale."""
-    if FRONTEND_DIST.exists():
-        src_dir = FRONTEND_DIR / "src"
-        if src_dir.exists():
-            latest_src = max(f.stat().st_mtime for f in src_dir.rglob("*") if f.is_file())
-            index_html = FRONTEND_DIST / "index.html"
-            if index_html.exists() and index_html.stat().st_mtime > latest_src:
-                print("Frontend build is up to date.")
-                return
+    index_html = FRONTEND_DIST / "index.html"
+    src_dir = FRONTEND_DIR / "src"
+    if index_html.exists() and src_dir.exists():
+        built_ns = index_html.stat().st_mtime_ns
+        # src/'s own mtime covers files deleted directly under it.
+        if (src_dir.stat().st_mtime_ns < built_ns
+                and not _modified_since(src_dir, built_ns)):
+            print("Frontend build is up to date.")
+            return
 
     print("Building frontend...")
     subprocess.run(